@@ -455,18 +455,27 @@ import sys
 import shlex
 import threading
 import queue
+import functools
+from collections import OrderedDict, deque
 import time
+import math
 import shutil
 import stat
+import signal
 import platform
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, List, Any, Callable, Tuple
+from typing import Optional, Dict, List, Any, Callable, Tuple, NamedTuple, Deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
 import urllib.request
+from urllib.parse import urlsplit
 import tempfile
+import io
 import hashlib
+from concurrent.futures import ThreadPoolExecutor, Future, TimeoutError as FutureTimeoutError
+import zlib
+import sqlite3
 
 # Optional imports with fallbacks
 try:
@@ -483,6 +492,16 @@ except ImportError:
     HAS_REQUESTS = False
     print("Warning: requests not installed. SponsorBlock will be disabled.")
 
+# orjson parses large yt-dlp dumps noticeably faster; accepts str or bytes.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so handlers are shared.
+try:
+    import orjson
+    _json_loads = orjson.loads
+    HAS_ORJSON = True
+except ImportError:
+    _json_loads = json.loads
+    HAS_ORJSON = False
+
 
 # ============================================================================
 # CONFIGURATION & CONSTANTS
@@ -516,16 +535,15 @@ def get_retry_delay(attempt: int) -> int:
 
 # Configuration paths - using proper config directory
 CONFIG_DIR = Path.home() / ".config" / "yt-dlp-gui"
-CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
 CONFIG_PATH = CONFIG_DIR / "config.json"
 SETTINGS_PATH = CONFIG_DIR / "settings.json"  # Separate file for settings
-HISTORY_PATH = CONFIG_DIR / "history.json"
+HISTORY_PATH = CONFIG_DIR / "history.json"  # Legacy, migrated into HISTORY_DB_PATH
+HISTORY_DB_PATH = CONFIG_DIR / "history.db"
 CACHE_DIR = Path.home() / ".cache" / "yt_dlp_gui"
 
 # Application Support directory for user-installed binaries (macOS standard)
 APP_SUPPORT_DIR = Path.home() / "Library" / "Application Support" / "YouTube 4K Downloader"
-APP_SUPPORT_DIR.mkdir(parents=True, exist_ok=True)
 
 # User-installed yt-dlp binary location
 USER_YTDLP_PATH = APP_SUPPORT_DIR / "yt-dlp"
@@ -539,6 +557,31 @@ YTDLP_RELEASES_URL = "https://github.com/yt-dlp/yt-dlp/releases"
 APP_GITHUB_API = "https://api.github.com/repos/bytePatrol/YT-DLP-GUI-for-MacOS/releases/latest"
 APP_RELEASES_URL = "https://github.com/bytePatrol/YT-DLP-GUI-for-MacOS/releases"
 
+@functools.lru_cache(maxsize=None)
+def _has_yt_dlp_module() -> bool:
+    """Whether yt-dlp is importable as a Python module (checked once)."""
+    try:
+        import yt_dlp
+        return True
+    except ImportError:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _find_system_python() -> Optional[str]:
+    """Find system Python that can run Homebrew scripts."""
+    candidates = [
+        '/opt/homebrew/bin/python3',      # Homebrew Python (Apple Silicon) - try first
+        '/usr/local/bin/python3',          # Homebrew Python (Intel)
+        '/usr/bin/python3',                # System Python (fallback)
+    ]
+    for python in candidates:
+        if os.path.isfile(python):
+            return python
+    return None
+
+
+@functools.lru_cache(maxsize=None)
 def find_executable(name: str) -> str:
     """
     Find executable, checking user-installed location first, then bundled resources.
@@ -549,6 +592,9 @@ def find_executable(name: str) -> str:
     3. Python module (pip-installed)
     4. System paths (Homebrew, etc.)
     
+    Results are cached for the session; call find_executable.cache_clear()
+    after installing or removing a binary.
+    
     Args:
         name: Name of the executable to find
         
@@ -576,20 +622,16 @@ def find_executable(name: str) -> str:
     # Special handling for yt-dlp: prefer Python module method
     if name == "yt-dlp":
         # Try to import yt-dlp as a Python module first (most reliable)
-        try:
-            import yt_dlp
+        if _has_yt_dlp_module():
             return "python-module"
-        except ImportError as e:
-            pass
         
-        # Check Homebrew paths
-        homebrew_paths = [
-            "/opt/homebrew/bin/yt-dlp",
-            "/usr/local/bin/yt-dlp",
-        ]
-        for p in homebrew_paths:
-            if os.path.isfile(p):
-                return p
+        # Check Homebrew paths (stops at the first hit)
+        homebrew_path = next(
+            (p for p in ("/opt/homebrew/bin/yt-dlp", "/usr/local/bin/yt-dlp") if os.path.isfile(p)),
+            None
+        )
+        if homebrew_path:
+            return homebrew_path
     
     # Check if it's available in PATH (includes venv)
     path = shutil.which(name)
@@ -597,23 +639,79 @@ def find_executable(name: str) -> str:
         return path
     
     # Fallback paths for other executables
-    fallback_paths = [
+    fallback_paths = (
         f"/opt/homebrew/bin/{name}",
         f"/usr/local/bin/{name}",
         f"/usr/bin/{name}",
-    ]
+    )
     
-    for p in fallback_paths:
-        if os.path.isfile(p):
-            return p
-    
-    return name  # Return just the name, let it fail later with clear error
+    # Return just the name if nothing matches, let it fail later with clear error
+    return next((p for p in fallback_paths if os.path.isfile(p)), name)
 
 # Binary paths - dynamically found
 YTDLP_PATH = find_executable("yt-dlp")
 FFMPEG_PATH = find_executable("ffmpeg")
 DENO_PATH = find_executable("deno")  # JavaScript runtime for yt-dlp
 
+
+@functools.lru_cache(maxsize=None)
+def ffmpeg_encoders(ffmpeg_path: str) -> Optional[frozenset]:
+    """
+    Names of the encoders an ffmpeg binary was built with (probed once per path).
+    
+    Returns None if ffmpeg could not be run, so callers can tell "not built
+    in" apart from "unknown".
+    """
+    try:
+        result = subprocess.run(
+            [ffmpeg_path, "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=10,
+            encoding='utf-8', errors='replace'
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    # Rows look like " V....D h264_videotoolbox    VideoToolbox H.264 Encoder";
+    # everything above the "------" line is the flag legend
+    _, _, table = result.stdout.partition("------")
+    return frozenset(
+        parts[1] for parts in (line.split() for line in table.splitlines())
+        if len(parts) >= 2
+    )
+
+
+# H.264 output bitrate tiers, tallest first: (minimum source height,
+# per_resolution_bitrates key, auto-mode bitrate). Auto mode runs higher than
+# the VP9 sources because H.264 is less efficient; 4K needs ~45Mbps to match.
+_BITRATE_TIERS = (
+    (2160, "2160", "45M"),
+    (1440, "1440", "20M"),
+    (1080, "1080", "8M"),
+    (720, "720", "5M"),
+    (0, "480", "2M"),
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _rate_control(video_bitrate: str) -> Tuple[str, str]:
+    """Return ffmpeg (maxrate, bufsize) for a target bitrate such as "8M"."""
+    try:
+        bitrate_num = float(video_bitrate.rstrip('MmKk'))
+    except ValueError:
+        return "10M", "16M"
+    return video_bitrate, f"{int(bitrate_num * 2)}M"
+
+
+# Seconds between forced keyframes when converting with SponsorBlock enabled,
+# so segment removal can cut on known keyframes and stream-copy instead of
+# re-encoding. Cut points move back by at most this much.
+SPONSORBLOCK_KEYFRAME_INTERVAL = 2
+
+# Buffer size for yt-dlp/ffmpeg output pipes, and the read size used on them,
+# so each read drains a whole burst of progress output in one syscall
+PIPE_BUFFER_SIZE = 65536
+
 # ============================================================================
 # COLOR SYSTEM - Professional Media Tool Design
 # ============================================================================
@@ -1635,6 +1733,10 @@ class UnviewablePlaylistError(YtDlpError):
         super().__init__(self.message)
 
 
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 class DownloadStatus(Enum):
     QUEUED = auto()
     ANALYZING = auto()
@@ -1646,7 +1748,7 @@ class DownloadStatus(Enum):
     CANCELLED = auto()
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class VideoFormat:
     """Represents a single video/audio format."""
     format_id: str
@@ -1692,7 +1794,7 @@ class VideoFormat:
         return f"{br:.0f} kbps"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Chapter:
     """Represents a chapter in a video."""
     index: int
@@ -1753,7 +1855,7 @@ class PlaylistItem:
         return f"{minutes}:{seconds:02d}"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class VideoInfo:
     """Represents video metadata."""
     id: str
@@ -1822,7 +1924,7 @@ class VideoInfo:
         return f"{minutes}m {seconds}s"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class DownloadTask:
     """Represents a download task in the queue."""
     id: str
@@ -1833,11 +1935,12 @@ class DownloadTask:
     progress: float = 0.0
     speed: Optional[str] = None
     eta: Optional[str] = None
-    download_speed: Optional[str] = None  # NEW: Download speed in Mbps
-    conversion_fps: Optional[str] = None  # NEW: Conversion FPS
+    download_speed_mbps: Optional[float] = None  # NEW: Download speed in Mbps
+    conversion_fps_value: Optional[float] = None  # NEW: Conversion FPS
     file_size: Optional[int] = None       # NEW: File size in bytes
     status_detail: Optional[str] = None   # v17.7.5: Detailed status message (e.g., "Processing chapters...")
     current_file_size: Optional[int] = None  # v17.7.5: Current size of output file being written
+    audio_downloading: bool = False  # Audio stream still downloading alongside the video
     error_message: Optional[str] = None
     created_at: datetime = field(default_factory=datetime.now)
     started_at: Optional[datetime] = None
@@ -1845,12 +1948,176 @@ class DownloadTask:
     # v19.0.0: Per-video trim settings
     trim_start: Optional[str] = None
     trim_end: Optional[str] = None
+    
+    # Speed and FPS are stored as numbers by the download threads and only
+    # turned into text when the UI reads them
+    @property
+    def download_speed(self) -> Optional[str]:
+        """Download speed as display text, e.g. "42.5 Mbps"."""
+        speed = self.download_speed_mbps
+        return None if speed is None else "%.1f Mbps" % speed
+    
+    @property
+    def conversion_fps(self) -> Optional[str]:
+        """Conversion FPS as display text, e.g. "60 fps"."""
+        fps = self.conversion_fps_value
+        return None if fps is None else "%.0f fps" % fps
+
+
+# ============================================================================
+# ON-DISK CACHES
+# ============================================================================
+
+class _SqliteTTLCache:
+    """
+    One SQLite table in CACHE_DIR whose rows expire after TTL_SECONDS.
+    
+    Subclasses name the file, table and value columns and encode/decode the
+    values; keys are hashed. Any failure is treated as a miss, and a cache
+    that can't be opened is disabled. Expired rows are deleted on open and
+    every PURGE_EVERY writes, so the file doesn't grow without limit.
+    """
+    
+    TTL_SECONDS = 3600
+    PURGE_EVERY = 100
+    NAME = "Cache"  # For the warning when the cache can't be opened
+    FILENAME = ""
+    TABLE = ""
+    KEY_COLUMN = "key"
+    VALUE_COLUMNS: Tuple[str, ...] = ()  # Column definitions after the key and fetched_at
+    
+    def __init__(self, cache_dir: Path = CACHE_DIR):
+        self._lock = threading.Lock()
+        self._conn = None
+        self._puts = 0
+        names = [column.split()[0] for column in self.VALUE_COLUMNS]
+        self._select_sql = (f"SELECT fetched_at, {', '.join(names)} FROM {self.TABLE} "
+                            f"WHERE {self.KEY_COLUMN} = ?")
+        self._insert_sql = (f"INSERT OR REPLACE INTO {self.TABLE} "
+                            f"({self.KEY_COLUMN}, fetched_at, {', '.join(names)}) "
+                            f"VALUES ({', '.join('?' * (len(names) + 2))})")
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(cache_dir / self.FILENAME),
+                                         isolation_level=None, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.TABLE} ("
+                f"{self.KEY_COLUMN} TEXT PRIMARY KEY, fetched_at INTEGER, "
+                f"{', '.join(self.VALUE_COLUMNS)})"
+            )
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.TABLE}_fetched_at ON {self.TABLE} (fetched_at)"
+            )
+            self._purge()
+        except (sqlite3.Error, OSError) as e:
+            print(f"Warning: {self.NAME} disabled: {e}")
+            self._conn = None
+    
+    @staticmethod
+    def _hash(key: str) -> str:
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _purge(self):
+        """Delete rows older than TTL_SECONDS (they could only ever miss)."""
+        self._conn.execute(
+            f"DELETE FROM {self.TABLE} WHERE fetched_at < ?",
+            (int(time.time()) - self.TTL_SECONDS,)
+        )
+    
+    def _get_row(self, key: str) -> Optional[Tuple]:
+        """Return the stored values for key if a fresh row exists."""
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(self._select_sql, (self._hash(key),)).fetchone()
+        except sqlite3.Error:
+            return None
+        if row is None or time.time() - row[0] >= self.TTL_SECONDS:
+            return None
+        return row[1:]
+    
+    def _put_row(self, key: str, *values):
+        """Store values for key."""
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute(self._insert_sql, (self._hash(key), int(time.time())) + values)
+                self._puts += 1
+                if self._puts % self.PURGE_EVERY == 0:
+                    self._purge()
+        except sqlite3.Error:
+            pass
+    
+    def clear(self):
+        """Drop every cached row."""
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute(f"DELETE FROM {self.TABLE}")
+        except sqlite3.Error:
+            pass
 
 
 # ============================================================================
 # SPONSORBLOCK API
 # ============================================================================
 
+class SponsorBlockCache(_SqliteTTLCache):
+    """
+    On-disk cache of SponsorBlock answers keyed by video ID and category set.
+    
+    Answers (including "no segments") are kept for a day, so re-downloading
+    a video skips the HTTPS round trip. Failed requests are not cached, and
+    any cache failure is treated as a miss.
+    """
+    
+    TTL_SECONDS = 24 * 3600
+    NAME = "SponsorBlock cache"
+    FILENAME = "sponsorblock.sqlite"
+    TABLE = "segments"
+    VALUE_COLUMNS = ("segments TEXT",)
+    
+    @staticmethod
+    def _key(video_id: str, categories: List[str]) -> str:
+        # Order and duplicates in the category list don't change the answer
+        return f"{video_id}:{','.join(sorted(set(categories)))}"
+    
+    def get(self, video_id: str, categories: List[str]) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached segment list if a fresh entry exists."""
+        row = self._get_row(self._key(video_id, categories))
+        if row is None:
+            return None
+        try:
+            return json.loads(row[0])
+        except ValueError:
+            return None
+    
+    def put(self, video_id: str, categories: List[str], segments: List[Dict[str, Any]]):
+        """Store the API answer for video_id and categories."""
+        try:
+            encoded = json.dumps(segments)
+        except (TypeError, ValueError):
+            return
+        self._put_row(self._key(video_id, categories), encoded)
+
+
+_sponsorblock_cache: Optional[SponsorBlockCache] = None
+_sponsorblock_cache_lock = threading.Lock()
+
+
+def get_sponsorblock_cache() -> SponsorBlockCache:
+    """Shared SponsorBlockCache for the process, created on first use."""
+    global _sponsorblock_cache
+    with _sponsorblock_cache_lock:
+        if _sponsorblock_cache is None:
+            _sponsorblock_cache = SponsorBlockCache()
+        return _sponsorblock_cache
+
+
 class SponsorBlockAPI:
     """Interface for SponsorBlock API to fetch segment information."""
     
@@ -1878,9 +2145,14 @@ class SponsorBlockAPI:
             print("WARNING: requests library not available, SponsorBlock disabled")
             return []
         
+        cache = get_sponsorblock_cache()
+        cached = cache.get(video_id, categories)
+        if cached is not None:
+            return cached
+        
         try:
-            # Build category filter string
-            category_param = "[" + ",".join(f'"{c}"' for c in categories) + "]"
+            # Build category filter string (each category once, stable order)
+            category_param = "[" + ",".join(f'"{c}"' for c in sorted(set(categories))) + "]"
             
             # Query API (using hash prefix for privacy)
             hash_prefix = SponsorBlockAPI.get_video_hash_prefix(video_id)
@@ -1890,6 +2162,7 @@ class SponsorBlockAPI:
             
             if response.status_code == 404:
                 # No segments found
+                cache.put(video_id, categories, [])
                 return []
             
             if response.status_code != 200:
@@ -1899,13 +2172,15 @@ class SponsorBlockAPI:
             data = response.json()
             
             # Find segments for this specific video
+            segments = []
             if isinstance(data, list):
                 for video_data in data:
                     if video_data.get('videoID') == video_id:
                         segments = video_data.get('segments', [])
-                        return segments
+                        break
             
-            return []
+            cache.put(video_id, categories, segments)
+            return segments
             
         except Exception as e:
             print(f"SponsorBlock API exception: {e}")
@@ -1926,16 +2201,14 @@ class SponsorBlockAPI:
         if not segments:
             return "select='1'"  # Keep everything
         
-        # Sort segments by start time
-        sorted_segments = sorted(segments, key=lambda x: x['segment'][0])
+        # Sort (start, end) pairs by start time - plain tuple comparison, no key function
+        removed_ranges = sorted((seg['segment'][0], seg['segment'][1]) for seg in segments)
         
         # Build list of time ranges to KEEP (inverse of segments to remove)
         keep_ranges = []
         last_end = 0.0
         
-        for seg in sorted_segments:
-            start, end = seg['segment']
-            
+        for start, end in removed_ranges:
             # Add the part before this segment
             if start > last_end:
                 keep_ranges.append((last_end, start))
@@ -2077,6 +2350,27 @@ def clean_youtube_url(url: str) -> str:
     return url
 
 
+_YT_HOSTS = frozenset({
+    "youtube.com", "www.youtube.com", "m.youtube.com",
+    "music.youtube.com", "youtu.be",
+})
+
+
+def _is_yt_url(text: str) -> bool:
+    """Check whether text is a URL on a YouTube host (not merely mentioning one)."""
+    text = text.strip()
+    if "://" not in text:
+        text = "//" + text  # Allow scheme-less "youtu.be/abc"
+    try:
+        u = urlsplit(text)
+        if u.scheme not in ("", "http", "https"):
+            return False
+        host = (u.hostname or "").lower()
+    except ValueError:
+        return False
+    return host in _YT_HOSTS
+
+
 def sanitize_filename(name: str, max_length: int = 200) -> str:
     """Create a filesystem-safe filename, removing problematic characters and emoji."""
     import unicodedata
@@ -2118,10 +2412,16 @@ def format_time(seconds: float) -> str:
     return f"{m:02d}:{s:02d}"
 
 
+# AppleScript string-literal escapes for notification text (single pass in C)
+_NOTIFY_ESCAPE = str.maketrans({'\\': '\\\\', '"': '\\"'})
+
+
 def send_notification(title: str, message: str):
     """Send macOS notification."""
     try:
-        script = f'display notification "{message}" with title "{title}"'
+        safe_title = title[:100].translate(_NOTIFY_ESCAPE)
+        safe_message = message[:200].translate(_NOTIFY_ESCAPE)
+        script = f'display notification "{safe_message}" with title "{safe_title}"'
         subprocess.run(["osascript", "-e", script], check=False, capture_output=True)
     except Exception:
         pass
@@ -2153,22 +2453,144 @@ def save_json_file(path: Path, data: Any):
         print(f"Failed to save {path}: {e}")
 
 
+def iter_pipe_batches(pipe, chunk_size: int = PIPE_BUFFER_SIZE):
+    """
+    Yield the lines of a binary pipe as bytes, one list per read.
+    
+    Reads with read1(), so one wakeup consumes everything the child has
+    written so far instead of going through a text-mode readline() per line;
+    each list holds the complete lines that read produced, letting callers
+    act once per burst. Both \n and \r end a line, since progress output
+    redraws with \r. Terminators and empty lines are dropped.
+    """
+    read1 = pipe.read1
+    buf = b""
+    while True:
+        chunk = read1(chunk_size)
+        if not chunk:
+            break
+        buf += chunk
+        if b"\r" in chunk:
+            buf = buf.replace(b"\r", b"\n")
+        *lines, buf = buf.split(b"\n")
+        lines = [line for line in lines if line]
+        if lines:
+            yield lines
+    if buf:
+        yield [buf]
+
+
+def iter_pipe_lines(pipe, chunk_size: int = PIPE_BUFFER_SIZE):
+    """Yield the lines of a binary pipe one at a time (see iter_pipe_batches)."""
+    for lines in iter_pipe_batches(pipe, chunk_size):
+        yield from lines
+
+
 # ============================================================================
 # YT-DLP INTERFACE
 # ============================================================================
 
+class MetadataCache(_SqliteTTLCache):
+    """
+    On-disk cache of raw yt-dlp output keyed by (cleaned) URL.
+    
+    Stores the -J JSON (zlib-compressed) and, if the JSON had no formats,
+    the --list-formats table, so re-opening a recently inspected video skips
+    the subprocess and network round trip entirely. Any cache failure is
+    treated as a miss.
+    """
+    
+    TTL_SECONDS = 3600
+    NAME = "Metadata cache"
+    FILENAME = "metadata.sqlite"
+    TABLE = "metadata"
+    KEY_COLUMN = "url"
+    VALUE_COLUMNS = ("ytdlp_json BLOB", "formats_table TEXT")
+    
+    @staticmethod
+    def _key(url: str, full: bool) -> str:
+        # Full fetches (with formats) and plain metadata fetches are separate rows
+        return f"full:{url}" if full else url
+    
+    def get(self, url: str, full: bool = False) -> Optional[Tuple[bytes, Optional[str]]]:
+        """Return (raw_json, formats_table or None) if a fresh entry exists."""
+        row = self._get_row(self._key(url, full))
+        if row is None:
+            return None
+        try:
+            return zlib.decompress(row[0]), row[1]
+        except zlib.error:
+            return None
+    
+    def put(self, url: str, raw_json: bytes, formats_table: Optional[str] = None,
+            full: bool = False):
+        """Store raw yt-dlp output for url."""
+        self._put_row(self._key(url, full), zlib.compress(raw_json), formats_table)
+
+
+# Token patterns for `yt-dlp --list-formats` table cells
+_RE_RES = re.compile(r'(\d+)x(\d+)')
+_RE_HEIGHT_P = re.compile(r'^(\d+)p\d*$')
+_RE_KBPS = re.compile(r'^\d+k$')
+_RE_MBPS = re.compile(r'^[\d.]+M$')
+_RE_SIZE = re.compile(r'^([\d.]+)([KMG])iB$')
+_SIZE_UNITS = {'K': 1024, 'M': 1024 * 1024, 'G': 1024 * 1024 * 1024}
+
+# Codec markers found in one scan per row; the lookahead also reports
+# overlapping hits so this matches independent substring tests exactly.
+# Markers are ASCII, so rows are scanned as lowered bytes.
+_RE_CODEC_MARKERS = re.compile(rb'(?=(avc|h264|vp0?9|av0?1|mp4a|aac|opus))')
+_CODEC_BY_MARKER = {
+    b'avc': 'h264', b'h264': 'h264',
+    b'vp9': 'vp9', b'vp09': 'vp9',
+    b'av1': 'av1', b'av01': 'av1',
+    b'mp4a': 'aac', b'aac': 'aac',
+    b'opus': 'opus',
+}
+_VCODEC_PRIORITY = ('h264', 'vp9', 'av1')
+_ACODEC_PRIORITY = ('aac', 'opus')
+
+# vcodec prefixes QuickTime plays natively (H.264 / HEVC); "hev" covers "hevc"
+_QT_VCODEC_MARKERS = ('avc', 'h264', 'hev')
+
+
+def _sort_formats(formats: List["VideoFormat"]) -> None:
+    """Sort formats in place by height, then bitrate, highest first.
+
+    Keys are built in one pass and compared as plain tuples; the negated
+    index keeps equal keys in their original order, as a stable reverse sort would.
+    """
+    decorated = [(f.height or 0, f.tbr or 0, -i, f) for i, f in enumerate(formats)]
+    decorated.sort(reverse=True)
+    formats[:] = [d[3] for d in decorated]
+
+
 class YtDlpInterface:
     """Interface for yt-dlp operations."""
     
+    INFO_CACHE_SIZE = 256  # Parsed VideoInfo objects kept in memory
+    EXTRACT_TIMEOUT = 90   # Seconds, same bound as the -J subprocess runs
+    
     def __init__(self, ytdlp_path: str = YTDLP_PATH):
         self.ytdlp_path = ytdlp_path
         self._version: Optional[str] = None
+        self._metadata_cache = MetadataCache()
+        # Parsed VideoInfo LRU, keyed by (cleaned_url, full fetch with formats)
+        self._info_cache: "OrderedDict[Tuple[str, bool], VideoInfo]" = OrderedDict()
+        self._info_cache_lock = threading.Lock()
+        self._is_available: Optional[bool] = None
+        # In-process YoutubeDL instances (python-module installs), created on
+        # first use and only touched by the single extractor worker
+        self._ydl = None
+        self._ydl_full = None
+        self._ydl_executor: Optional[ThreadPoolExecutor] = None
+        self._ydl_lock = threading.Lock()
         # Check if we should use Python module method
         self._use_python_module = (ytdlp_path == "python-module")
         
         if not self._use_python_module:
             # Detect if we need to use system Python for script execution
-            self._system_python = self._find_system_python()
+            self._system_python = _find_system_python()
             self._use_system_python = (
                 (self.ytdlp_path.startswith('/opt/homebrew') or 
                  self.ytdlp_path.startswith('/usr/local')) and
@@ -2184,12 +2606,16 @@ class YtDlpInterface:
         
         Call this after installing an update to ensure the new binary is used.
         """
+        find_executable.cache_clear()  # Binary location may have changed
         self.ytdlp_path = find_executable("yt-dlp")
         self._version = None  # Clear cached version
+        self._is_available = None
+        self._ydl = self._ydl_full = None
+        self.clear_metadata_cache()  # New extractor may see different formats
         self._use_python_module = (self.ytdlp_path == "python-module")
         
         if not self._use_python_module:
-            self._system_python = self._find_system_python()
+            self._system_python = _find_system_python()
             self._use_system_python = (
                 (self.ytdlp_path.startswith('/opt/homebrew') or 
                  self.ytdlp_path.startswith('/usr/local')) and
@@ -2199,18 +2625,6 @@ class YtDlpInterface:
             self._system_python = None
             self._use_system_python = False
     
-    def _find_system_python(self) -> Optional[str]:
-        """Find system Python that can run Homebrew scripts."""
-        candidates = [
-            '/opt/homebrew/bin/python3',      # Homebrew Python (Apple Silicon) - try first
-            '/usr/local/bin/python3',          # Homebrew Python (Intel)
-            '/usr/bin/python3',                # System Python (fallback)
-        ]
-        for python in candidates:
-            if os.path.isfile(python):
-                return python
-        return None
-    
     def _build_command(self, args: List[str]) -> List[str]:
         """Build command to execute yt-dlp."""
         # Check if we have a bundled deno and add --js-runtimes flag
@@ -2227,15 +2641,75 @@ class YtDlpInterface:
         else:
             return [self.ytdlp_path] + js_runtime_args + args
     
+    def _extract_in_process(self, url: str, full: bool) -> Optional[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+        """
+        Run yt-dlp's extractor inside this process (python-module installs only).
+        
+        Skips the interpreter start-up of `python -m yt_dlp`. Returns
+        (info_dict, None) on success or (None, error_text) on failure. The
+        dict is what -J would print, already parsed, so it goes straight to
+        _parse_video_info() and is only serialized for the disk cache.
+        
+        Returns None if the extractor doesn't finish within EXTRACT_TIMEOUT;
+        the stuck worker is abandoned (later lookups get a fresh one) and the
+        caller should fall back to running yt-dlp as a subprocess.
+        """
+        with self._ydl_lock:
+            executor = self._ydl_executor
+            if executor is None:
+                executor = self._ydl_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="ytdlp-extract"
+                )
+        future = executor.submit(self._run_extractor, url, full)
+        try:
+            return future.result(timeout=self.EXTRACT_TIMEOUT)
+        except FutureTimeoutError:
+            with self._ydl_lock:
+                if self._ydl_executor is executor:
+                    self._ydl_executor = None
+                    self._ydl = self._ydl_full = None
+            executor.shutdown(wait=False)
+            return None
+    
+    def _run_extractor(self, url: str, full: bool) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """Extractor worker body for _extract_in_process()."""
+        try:
+            from yt_dlp import YoutubeDL
+            
+            ydl = self._ydl_full if full else self._ydl
+            if ydl is None:
+                params = {
+                    "quiet": True,
+                    "no_warnings": True,
+                    "skip_download": True,
+                    "noplaylist": True,
+                    "socket_timeout": 10,  # Same as --socket-timeout 10
+                }
+                if DENO_PATH and os.path.isfile(DENO_PATH):
+                    params["js_runtimes"] = {"deno": {"path": DENO_PATH}}
+                if full:
+                    # Same as --remote-components ejs:github
+                    params["remote_components"] = {"ejs:github"}
+                ydl = YoutubeDL(params)
+                if full:
+                    self._ydl_full = ydl
+                else:
+                    self._ydl = ydl
+            return ydl.sanitize_info(ydl.extract_info(url, download=False)), None
+        except Exception as e:
+            # DownloadError or anything else the extractor raises: report it
+            # like yt-dlp's stderr, as the subprocess path would
+            return None, str(e)
+    
     @property
     def is_available(self) -> bool:
-        if self._use_python_module:
-            try:
-                import yt_dlp
-                return True
-            except ImportError:
-                return False
-        return os.path.isfile(self.ytdlp_path)
+        # Computed once per path; refresh_path() resets it
+        if self._is_available is None:
+            if self._use_python_module:
+                self._is_available = _has_yt_dlp_module()
+            else:
+                self._is_available = os.path.isfile(self.ytdlp_path)
+        return self._is_available
     
     def get_version(self) -> str:
         """Get yt-dlp version string."""
@@ -2255,27 +2729,72 @@ class YtDlpInterface:
             print(f"Warning: Could not get yt-dlp version: {e}")
         return "Not found"
     
+    def _get_cached_info(self, key: Tuple[str, bool]) -> Optional[VideoInfo]:
+        """Return an already-parsed VideoInfo from the in-memory LRU."""
+        with self._info_cache_lock:
+            info = self._info_cache.get(key)
+            if info is not None:
+                self._info_cache.move_to_end(key)
+            return info
+    
+    def _cache_info(self, key: Tuple[str, bool], info: VideoInfo) -> VideoInfo:
+        """Remember a parsed VideoInfo, evicting the least recently used."""
+        with self._info_cache_lock:
+            self._info_cache[key] = info
+            self._info_cache.move_to_end(key)
+            if len(self._info_cache) > self.INFO_CACHE_SIZE:
+                self._info_cache.popitem(last=False)
+        return info
+    
+    def clear_metadata_cache(self):
+        """Clear cached video metadata (in memory and on disk)."""
+        with self._info_cache_lock:
+            self._info_cache.clear()
+        self._metadata_cache.clear()
+    
     def fetch_video_info(self, url: str) -> VideoInfo:
         """Fetch video metadata using yt-dlp -J."""
         try:
             # Clean the URL to remove playlist parameters
             cleaned_url = clean_youtube_url(url)
+            
+            info = self._get_cached_info((cleaned_url, False))
+            if info is not None:
+                return info
+            
+            cached = self._metadata_cache.get(cleaned_url)
+            if cached:
+                return self._cache_info(
+                    (cleaned_url, False), self._parse_video_info(_json_loads(cached[0]), cleaned_url)
+                )
 
-            # v19.0.0: Increased timeout from 30s to 90s
-            # Cookie authentication and YouTube rate limiting can cause delays
-            result = subprocess.run(
-                self._build_command(["-J", "--no-playlist", cleaned_url]),
-                capture_output=True, text=True, check=False, timeout=90,
-                encoding='utf-8', errors='replace'
-            )
+            extracted = None
+            if self._use_python_module:
+                extracted = self._extract_in_process(cleaned_url, full=False)
+            if extracted is not None:
+                data, error_text = extracted
+                if error_text is not None:
+                    raise RuntimeError(f"yt-dlp error: {error_text}")
+                raw_json = json.dumps(data).encode('utf-8')  # For the disk cache only
+            else:
+                # v19.0.0: Increased timeout from 30s to 90s
+                # Cookie authentication and YouTube rate limiting can cause delays
+                # Bytes mode: the JSON goes straight to the parser without a str copy
+                result = subprocess.run(
+                    self._build_command(["-J", "--no-playlist", cleaned_url]),
+                    capture_output=True, check=False, timeout=90
+                )
 
-            if result.returncode != 0:
-                raise RuntimeError(f"yt-dlp error: {result.stderr.strip()}")
+                if result.returncode != 0:
+                    stderr_text = result.stderr.decode('utf-8', errors='replace').strip()
+                    raise RuntimeError(f"yt-dlp error: {stderr_text}")
+                raw_json = result.stdout
+                data = _json_loads(raw_json)
 
-            data = json.loads(result.stdout)
-            return self._parse_video_info(data, cleaned_url)
+            self._metadata_cache.put(cleaned_url, raw_json)
+            return self._cache_info((cleaned_url, False), self._parse_video_info(data, cleaned_url))
 
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             raise RuntimeError(f"Failed to parse yt-dlp output: {e}")
         except subprocess.TimeoutExpired:
             raise RuntimeError(
@@ -2287,7 +2806,10 @@ class YtDlpInterface:
             )
     
     def fetch_full_info(self, url: str) -> VideoInfo:
-        """Fetch full video info including all formats using --list-formats.
+        """Fetch full video info including all formats.
+        
+        Formats come from the same -J call as the metadata; the
+        --list-formats text table is only consulted if the JSON has none.
         
         Raises:
             AgeRestrictedError: If the video is age-restricted
@@ -2302,55 +2824,86 @@ class YtDlpInterface:
             # This prevents yt-dlp from trying to fetch playlist metadata
             cleaned_url = clean_youtube_url(url)
             
-            # First get basic metadata with -J
-            # --no-playlist ensures we only get info for the single video
-            # v19.0.0: Increased timeout from 30s to 90s for slower connections
-            result_info = subprocess.run(
-                self._build_command(["-J", "--no-playlist", cleaned_url]),
-                capture_output=True, text=True, check=False, timeout=90,
-                encoding='utf-8', errors='replace'
-            )
-            
-            # Check for specific error conditions in stderr
-            stderr_text = result_info.stderr.strip() if result_info.stderr else ""
+            info = self._get_cached_info((cleaned_url, True))
+            if info is not None:
+                return info
+            
+            cached = self._metadata_cache.get(cleaned_url, full=True)
+            if cached:
+                info = self._parse_video_info(_json_loads(cached[0]), cleaned_url, include_formats=True)
+                if cached[1]:
+                    info.formats = self._parse_format_table(cached[1])
+                return self._cache_info((cleaned_url, True), info)
+            
+            # One yt-dlp run gives metadata and the full format list
+            extracted = None
+            if self._use_python_module:
+                extracted = self._extract_in_process(cleaned_url, full=True)
+            if extracted is not None:
+                # Already parsed; serialized below only if it gets cached
+                data, stderr_text = extracted
+                raw_json = None
+            else:
+                # --no-playlist ensures we only get info for the single video
+                # v19.0.0: Increased timeout from 30s to 90s for slower connections
+                result_info = subprocess.run(
+                    self._build_command([
+                        "-J",
+                        "--no-playlist",
+                        "--remote-components", "ejs:github",
+                        "--socket-timeout", "10",
+                        cleaned_url
+                    ]),
+                    capture_output=True, check=False, timeout=90  # Bytes mode, see fetch_video_info
+                )
+                raw_json, stderr_text = result_info.stdout, None
+                if result_info.returncode != 0:
+                    stderr_text = result_info.stderr.decode('utf-8', errors='replace').strip()
             
-            if result_info.returncode != 0:
+            if stderr_text is not None:
                 # Parse the error to provide specific feedback
                 error_info = self._parse_ytdlp_error(stderr_text, url)
                 raise error_info
             
-            data = json.loads(result_info.stdout)
-            info = self._parse_video_info(data, cleaned_url, include_formats=False)
-            
-            # Now get formats using --list-formats (this shows ALL formats)
-            # --no-playlist ensures we only get formats for the single video
-            # v19.0.0: Increased timeout from 30s to 90s
-            result_formats = subprocess.run(
-                self._build_command([
-                    "--list-formats",
-                    "--no-playlist",
-                    "--remote-components", "ejs:github",
-                    cleaned_url
-                ]),
-                capture_output=True, text=True, check=False, timeout=90,
-                encoding='utf-8', errors='replace'
-            )
-            
-            # Check for errors in format listing too
-            if result_formats.returncode != 0:
-                format_stderr = result_formats.stderr.strip() if result_formats.stderr else ""
-                # Check if this is an age-restriction or other specific error
-                error_info = self._parse_ytdlp_error(format_stderr, url)
-                if isinstance(error_info, (AgeRestrictedError, PrivateVideoError, VideoUnavailableError, LoginRequiredError)):
-                    raise error_info
+            if raw_json is not None:
+                data = _json_loads(raw_json)
+            info = self._parse_video_info(data, cleaned_url, include_formats=True)
+            formats_table = None
+            
+            if not info.formats:
+                # Rare: no usable formats in the JSON - fall back to the text table
+                result_formats = subprocess.run(
+                    self._build_command([
+                        "--list-formats",
+                        "--no-playlist",
+                        "--remote-components", "ejs:github",
+                        cleaned_url
+                    ]),
+                    capture_output=True, text=True, check=False, timeout=90,
+                    encoding='utf-8', errors='replace'
+                )
+                
+                # Check for errors in format listing too
+                if result_formats.returncode != 0:
+                    format_stderr = result_formats.stderr.strip() if result_formats.stderr else ""
+                    # Check if this is an age-restriction or other specific error
+                    error_info = self._parse_ytdlp_error(format_stderr, url)
+                    if isinstance(error_info, (AgeRestrictedError, PrivateVideoError, VideoUnavailableError, LoginRequiredError)):
+                        raise error_info
+                else:
+                    # Parse the format table output
+                    formats_table = result_formats.stdout
+                    info.formats = self._parse_format_table(formats_table)
             
-            if result_formats.returncode == 0:
-                # Parse the format table output
-                info.formats = self._parse_format_table(result_formats.stdout)
+            if info.formats:
+                if raw_json is None:
+                    raw_json = json.dumps(data).encode('utf-8')
+                self._metadata_cache.put(cleaned_url, raw_json, formats_table, full=True)
+                self._cache_info((cleaned_url, True), info)
             
             return info
             
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             raise RuntimeError(f"Failed to parse yt-dlp output: {e}")
         except subprocess.TimeoutExpired:
             raise RuntimeError(
@@ -2396,70 +2949,100 @@ class YtDlpInterface:
             
             # Use --flat-playlist to get playlist entries without downloading each video's info
             # This is MUCH faster than fetching full info for each video
+            # -j prints one JSON object per entry, so entries are parsed as they
+            # stream in instead of buffering one large -J document
             # v19.0.0: Increased timeout from 60s to 120s for large playlists
-            result = subprocess.run(
-                self._build_command([
-                    "-J",
-                    "--flat-playlist",
-                    parsed.playlist_url
-                ]),
-                capture_output=True, text=True, check=False, timeout=120,
-                encoding='utf-8', errors='replace'
-            )
+            playlist_items = []
+            first_entry = None
+            timed_out = threading.Event()
             
-            if result.returncode != 0:
-                stderr_text = result.stderr.strip() if result.stderr else ""
+            with tempfile.TemporaryFile() as stderr_file:
+                process = subprocess.Popen(
+                    self._build_command([
+                        "-j",
+                        "--flat-playlist",
+                        parsed.playlist_url
+                    ]),
+                    stdout=subprocess.PIPE, stderr=stderr_file,
+                    start_new_session=True  # Own process group, so a kill reaches any children
+                )
                 
-                # Check for "unviewable" playlist error
-                if "unviewable" in stderr_text.lower() or "unavailable" in stderr_text.lower():
-                    raise UnviewablePlaylistError(
-                        playlist_id=parsed.playlist_id,
-                        reason="unviewable or private",
-                        video_id=parsed.video_id
-                    )
+                def kill_group():
+                    try:
+                        os.killpg(process.pid, signal.SIGKILL)
+                    except (ProcessLookupError, PermissionError):
+                        pass
                 
-                raise RuntimeError(f"Failed to fetch playlist: {stderr_text[:200]}")
-            
-            data = json.loads(result.stdout)
-            
-            # Parse playlist metadata
-            playlist_id = data.get("id", parsed.playlist_id)
-            playlist_title = data.get("title", "Unknown Playlist")
-            playlist_channel = data.get("channel") or data.get("uploader", "Unknown")
-            playlist_thumbnail = data.get("thumbnail")
-            
-            # Parse playlist entries
-            entries = data.get("entries", [])
-            playlist_items = []
-            
-            for idx, entry in enumerate(entries, start=1):
-                if entry is None:
-                    continue  # Skip unavailable videos
+                def on_timeout():
+                    timed_out.set()
+                    kill_group()
                 
-                video_id = entry.get("id")
-                if not video_id:
-                    continue
+                watchdog = threading.Timer(120, on_timeout)
+                watchdog.start()
+                try:
+                    for idx, line in enumerate(process.stdout, start=1):
+                        if not line.strip():
+                            continue
+                        entry = _json_loads(line)
+                        if first_entry is None:
+                            first_entry = entry
+                        
+                        video_id = entry.get("id")
+                        if not video_id:
+                            continue
+                        
+                        idx = entry.get("playlist_index") or idx
+                        item = PlaylistItem(
+                            id=video_id,
+                            title=entry.get("title", f"Video {idx}"),
+                            url=f"https://www.youtube.com/watch?v={video_id}",
+                            index=idx,
+                            duration=entry.get("duration"),
+                            channel=entry.get("channel") or entry.get("uploader"),
+                            thumbnail=entry.get("thumbnail")
+                        )
+                        playlist_items.append(item)
+                    returncode = process.wait()
+                finally:
+                    watchdog.cancel()
+                    if process.poll() is None:
+                        kill_group()
+                        process.wait()
+                    process.stdout.close()
                 
-                item = PlaylistItem(
-                    id=video_id,
-                    title=entry.get("title", f"Video {idx}"),
-                    url=f"https://www.youtube.com/watch?v={video_id}",
-                    index=idx,
-                    duration=entry.get("duration"),
-                    channel=entry.get("channel") or entry.get("uploader"),
-                    thumbnail=entry.get("thumbnail")
-                )
-                playlist_items.append(item)
+                if timed_out.is_set():
+                    raise subprocess.TimeoutExpired(process.args, 120)
+                
+                if returncode != 0:
+                    stderr_file.seek(0)
+                    stderr_text = stderr_file.read().decode('utf-8', errors='replace').strip()
+                    
+                    # Check for "unviewable" playlist error
+                    if "unviewable" in stderr_text.lower() or "unavailable" in stderr_text.lower():
+                        raise UnviewablePlaylistError(
+                            playlist_id=parsed.playlist_id,
+                            reason="unviewable or private",
+                            video_id=parsed.video_id
+                        )
+                    
+                    raise RuntimeError(f"Failed to fetch playlist: {stderr_text[:200]}")
+            
+            # Playlist metadata is repeated on every entry as playlist_* fields
+            first_entry = first_entry or {}
+            playlist_id = first_entry.get("playlist_id") or parsed.playlist_id
+            playlist_title = first_entry.get("playlist_title") or first_entry.get("playlist") or "Unknown Playlist"
+            playlist_channel = (first_entry.get("playlist_channel")
+                                or first_entry.get("playlist_uploader") or "Unknown")
             
             # Create VideoInfo representing the playlist
             info = VideoInfo(
                 id=playlist_id,
                 title=playlist_title,
                 url=parsed.playlist_url,
-                thumbnail=playlist_thumbnail,
+                thumbnail=None,  # Not included in per-entry output (never displayed)
                 duration=None,  # Playlists don't have a single duration
                 channel=playlist_channel,
-                view_count=data.get("view_count"),
+                view_count=None,
                 is_playlist=True,
                 playlist_count=len(playlist_items),
                 playlist_title=playlist_title,
@@ -2468,7 +3051,7 @@ class YtDlpInterface:
             
             return info
             
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             raise RuntimeError(f"Failed to parse playlist data: {e}")
         except subprocess.TimeoutExpired:
             raise RuntimeError("Playlist fetch timed out (playlist may be too large)")
@@ -2570,9 +3153,12 @@ class YtDlpInterface:
             line = line.strip()
             if not line or line.startswith('[') or '---' in line:
                 continue
+            # ASCII bytes, lowered once ('?' stands in for non-ASCII so
+            # markers never join across a dropped character)
+            line_bytes = line.encode('ascii', 'replace').lower()
             
             # Skip audio-only lines (we want video formats)
-            if 'audio only' in line.lower() and 'video' not in line.lower():
+            if b'audio only' in line_bytes and b'video' not in line_bytes:
                 continue
             
             # Split by vertical bar separator to get sections
@@ -2591,149 +3177,93 @@ class YtDlpInterface:
                 format_id = parts[0]
                 ext = parts[1]
                 
-                # Parse resolution (look for patterns like 1920x1080, 1280x720, etc.)
+                # Single pass over the tokens. Resolution/height/fps and file
+                # sizes keep the last match in the row; bitrate keeps the first.
                 height = None
                 width = None
                 resolution = None
                 fps = None
+                tbr = None
+                tbr_seen = False
+                filesize = None
+                filesize_approx = None
                 
                 for part in parts:
                     # Parse resolution like "1920x1080"
                     if 'x' in part and not part.startswith('0x'):
-                        res_match = re.match(r'(\d+)x(\d+)', part)
+                        res_match = _RE_RES.match(part)
                         if res_match:
                             width = int(res_match.group(1))
                             height = int(res_match.group(2))
                             resolution = f"{width}x{height}"
+                        continue
+                    
                     # Parse height like "1080p" or "1080p60"
-                    elif re.match(r'^\d+p\d*$', part):
-                        height_match = re.match(r'^(\d+)p', part)
-                        if height_match:
-                            height = int(height_match.group(1))
-                            resolution = part
-                    # Parse FPS (standalone number between 24-120)
-                    elif part.isdigit() and 24 <= int(part) <= 120:
-                        fps = int(part)
-                
-                # Skip if no valid height found or too low
-                if not height or height < 100:
-                    continue
-                
-                # Look for codecs in the line
-                vcodec = None
-                acodec = None
-                line_lower = line.lower()
-                
-                if 'avc1' in line_lower or 'h264' in line_lower or 'avc' in line_lower:
-                    vcodec = 'h264'
-                elif 'vp9' in line_lower or 'vp09' in line_lower:
-                    vcodec = 'vp9'
-                elif 'av01' in line_lower or 'av1' in line_lower:
-                    vcodec = 'av1'
-                
-                if 'mp4a' in line_lower or 'aac' in line_lower:
-                    acodec = 'aac'
-                elif 'opus' in line_lower:
-                    acodec = 'opus'
-                
-                # Determine if video/audio only
-                is_video_only = 'video only' in line_lower
-                is_audio_only = 'audio only' in line_lower
-                
-                # Parse bitrate (look for patterns like "4364k", "1.8M", etc.)
-                tbr = None
-                for part in parts:
-                    # Match patterns like "4364k" or "1181k"
-                    if re.match(r'^\d+k$', part):
-                        try:
-                            tbr = int(part[:-1])
-                        except:
-                            pass
-                        break
-                    # Match patterns like "1.8M" or "4M"
-                    elif re.match(r'^[\d.]+M$', part):
-                        try:
-                            tbr = int(float(part[:-1]) * 1000)
-                        except:
-                            pass
-                        break
-                
-                # Parse file size (look for patterns like "668.33MiB", "91.60MiB", "1.5GiB")
-                filesize = None
-                filesize_approx = None
-                for part in parts:
-                    # Remove leading ~ for approximate sizes
-                    size_part = part.lstrip('~')
-                    is_approx = part.startswith('~')
+                    height_match = _RE_HEIGHT_P.match(part)
+                    if height_match:
+                        height = int(height_match.group(1))
+                        resolution = part
+                        continue
                     
-                    # Match MiB sizes like "668.33MiB"
-                    mib_match = re.match(r'^([\d.]+)MiB$', size_part)
-                    if mib_match:
-                        try:
-                            size_val = float(mib_match.group(1))
-                            size_bytes = int(size_val * 1024 * 1024)
-                            if is_approx:
-                                filesize_approx = size_bytes
-                            else:
-                                filesize = size_bytes
-                        except:
-                            pass
+                    # Parse FPS (standalone number between 24-120)
+                    if part.isdigit():
+                        if 24 <= int(part) <= 120:
+                            fps = int(part)
                         continue
                     
-                    # Match GiB sizes like "1.5GiB"
-                    gib_match = re.match(r'^([\d.]+)GiB$', size_part)
-                    if gib_match:
+                    # Parse bitrate like "4364k" or "1.8M" (first match only)
+                    if not tbr_seen and (_RE_KBPS.match(part) or _RE_MBPS.match(part)):
+                        tbr_seen = True
                         try:
-                            size_val = float(gib_match.group(1))
-                            size_bytes = int(size_val * 1024 * 1024 * 1024)
-                            if is_approx:
-                                filesize_approx = size_bytes
+                            if part.endswith('k'):
+                                tbr = int(part[:-1])
                             else:
-                                filesize = size_bytes
-                        except:
+                                tbr = int(float(part[:-1]) * 1000)
+                        except ValueError:
                             pass
                         continue
                     
-                    # Match KiB sizes like "500KiB"
-                    kib_match = re.match(r'^([\d.]+)KiB$', size_part)
-                    if kib_match:
-                        try:
-                            size_val = float(kib_match.group(1))
-                            size_bytes = int(size_val * 1024)
-                            if is_approx:
+                    # Parse file size like "668.33MiB", "1.5GiB", "~500KiB"
+                    if part.endswith('iB'):
+                        size_match = _RE_SIZE.match(part.lstrip('~'))
+                        if size_match:
+                            try:
+                                size_bytes = int(float(size_match.group(1)) * _SIZE_UNITS[size_match.group(2)])
+                            except ValueError:
+                                continue
+                            if part.startswith('~'):
                                 filesize_approx = size_bytes
                             else:
                                 filesize = size_bytes
-                        except:
-                            pass
-                        continue
                 
-                fmt = VideoFormat(
-                    format_id=format_id,
-                    ext=ext,
-                    resolution=resolution,
-                    height=height,
-                    width=width,
-                    fps=fps or 30,
-                    vcodec=vcodec,
-                    acodec=acodec,
-                    filesize=filesize,
-                    filesize_approx=filesize_approx,
-                    tbr=tbr,
-                    vbr=None,
-                    abr=None,
-                    is_video_only=is_video_only,
-                    is_audio_only=is_audio_only,
-                    is_quicktime_compatible=False,  # We'll convert anyway
-                )
-                formats.append(fmt)
+                # Skip if no valid height found or too low
+                if not height or height < 100:
+                    continue
+                
+                # Look for codecs in the line (h264 > vp9 > av1, aac > opus)
+                found = {_CODEC_BY_MARKER[m] for m in _RE_CODEC_MARKERS.findall(line_bytes)}
+                vcodec = next((c for c in _VCODEC_PRIORITY if c in found), None)
+                acodec = next((c for c in _ACODEC_PRIORITY if c in found), None)
+                
+                # Determine if video/audio only
+                is_video_only = b'video only' in line_bytes
+                is_audio_only = b'audio only' in line_bytes
+                
+                # Positional, in VideoFormat field order (no kwargs dict per format)
+                formats.append(VideoFormat(
+                    format_id, ext, resolution, height, width, fps or 30,
+                    vcodec, acodec, filesize, filesize_approx,
+                    tbr, None, None,            # tbr, vbr, abr
+                    is_video_only, is_audio_only,
+                    False,                      # is_quicktime_compatible - we'll convert anyway
+                ))
                 
             except Exception as e:
                 # Skip malformed lines
                 continue
         
         # Sort by height descending, then by bitrate
-        formats.sort(key=lambda x: (x.height or 0, x.tbr or 0), reverse=True)
+        _sort_formats(formats)
         return formats
     
     def _parse_video_info(self, data: dict, url: str, include_formats: bool = False) -> VideoInfo:
@@ -2779,13 +3309,27 @@ class YtDlpInterface:
         formats = []
         
         for f in formats_data:
-            vcodec = (f.get("vcodec") or "").lower()
-            acodec = (f.get("acodec") or "").lower()
+            # Cheap rejections first - storyboards/thumbnails are common and
+            # get skipped before any other field is read
             ext = (f.get("ext") or "").lower()
-            height = f.get("height")
-            width = f.get("width")
+            if ext in ("mhtml", "jpg", "png", "webp"):
+                continue
+            
+            # Skip storyboard format notes
+            if "storyboard" in (f.get("format_note") or "").lower():
+                continue
+            
+            # Skip formats with no video codec AND no audio codec
+            vcodec = (f.get("vcodec") or "").lower()
+            acodec = (f.get("acodec") or "").lower()
+            has_video = vcodec not in ("", "none")
+            has_audio = acodec not in ("", "none")
+            if not has_video and not has_audio:
+                continue
+            
+            height = f.get("height")
+            width = f.get("width")
             resolution = f.get("resolution")
-            format_note = (f.get("format_note") or "").lower()
             format_id = f.get("format_id", "")
             
             # BUGFIX v16.2.1: If height is missing, try to parse from resolution string
@@ -2799,77 +3343,36 @@ class YtDlpInterface:
                     except:
                         pass
             
-            # Skip storyboard/thumbnail formats
-            if ext in ("mhtml", "jpg", "png", "webp"):
-                continue
-            
-            # Skip storyboard format notes
-            if "storyboard" in format_note:
-                continue
-            
-            # Skip formats with no video codec AND no audio codec
-            if vcodec in ("", "none") and acodec in ("", "none"):
-                continue
-            
             # Skip very low resolutions that are likely storyboards (under 100p)
             # But allow audio-only formats (height=None or 0)
             if height and height < 100:
                 continue
             
-            is_video_only = vcodec not in ("", "none") and acodec in ("", "none")
-            is_audio_only = vcodec in ("", "none") and acodec not in ("", "none")
+            is_video_only = has_video and not has_audio
+            is_audio_only = has_audio and not has_video
             
             # Check QuickTime compatibility (has both video AND audio, H.264/HEVC)
             is_qt = (
+                has_video and has_audio and
                 ext in ("mp4", "m4v", "mov") and
-                vcodec not in ("", "none") and acodec not in ("", "none") and
-                any(c in vcodec for c in ("avc", "h264", "hev", "hevc"))
+                (vcodec.startswith(_QT_VCODEC_MARKERS) or
+                 any(c in vcodec for c in _QT_VCODEC_MARKERS))
             )
             
-            fmt = VideoFormat(
-                format_id=format_id,
-                ext=ext,
-                resolution=resolution,
-                height=height,
-                width=width,
-                fps=f.get("fps"),
-                vcodec=vcodec if vcodec not in ("", "none") else None,
-                acodec=acodec if acodec not in ("", "none") else None,
-                filesize=f.get("filesize"),
-                filesize_approx=f.get("filesize_approx"),
-                tbr=f.get("tbr"),
-                vbr=f.get("vbr"),
-                abr=f.get("abr"),
-                is_video_only=is_video_only,
-                is_audio_only=is_audio_only,
-                is_quicktime_compatible=is_qt,
-            )
-            formats.append(fmt)
+            # Positional, in VideoFormat field order (no kwargs dict per format)
+            formats.append(VideoFormat(
+                format_id, ext, resolution, height, width, f.get("fps"),
+                vcodec if has_video else None,
+                acodec if has_audio else None,
+                f.get("filesize"), f.get("filesize_approx"),
+                f.get("tbr"), f.get("vbr"), f.get("abr"),
+                is_video_only, is_audio_only, is_qt,
+            ))
         
         # Sort by height (resolution) descending, then by bitrate
-        formats.sort(key=lambda x: (x.height or 0, x.tbr or 0), reverse=True)
+        _sort_formats(formats)
         return formats
     
-    def download(self, url: str, format_id: str, output_template: str,
-                 progress_callback: Optional[Callable] = None) -> subprocess.Popen:
-        """Start a download process."""
-        cmd = [
-            self.ytdlp_path,
-            "--newline",
-            "-f", format_id,
-            "-o", output_template,
-            url
-        ]
-        
-        return subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            encoding='utf-8',
-            errors='replace'
-        )
-    
     def check_update(self) -> tuple[bool, str]:
         """Check for and apply yt-dlp updates."""
         try:
@@ -2880,11 +3383,31 @@ class YtDlpInterface:
             output = result.stdout + result.stderr
             success = result.returncode == 0
             self._version = None  # Clear cached version
+            self.clear_metadata_cache()  # Updated extractor may parse differently
             return success, output.strip()
         except Exception as e:
             return False, str(e)
 
 
+
+_default_interface: Optional[YtDlpInterface] = None
+_default_interface_lock = threading.Lock()
+
+
+def get_ytdlp() -> YtDlpInterface:
+    """
+    Shared YtDlpInterface for the process, created on first use.
+    
+    Its state (resolved path, version, metadata caches, in-process
+    YoutubeDL) is effectively global; refresh_path() updates it for all users.
+    """
+    global _default_interface
+    with _default_interface_lock:
+        if _default_interface is None:
+            _default_interface = YtDlpInterface()
+        return _default_interface
+
+
 # ============================================================================
 # THUMBNAIL MANAGER
 # ============================================================================
@@ -2892,10 +3415,64 @@ class YtDlpInterface:
 class ThumbnailManager:
     """Manages thumbnail downloading and caching."""
     
+    MAX_CACHE = 512          # CTkImages kept in memory (LRU)
+    DISK_MAX_AGE_DAYS = 30   # Disk-cached thumbnails older than this are swept
+    
     def __init__(self, cache_dir: Path = CACHE_DIR):
         self.cache_dir = cache_dir / "thumbnails"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self._cache: Dict[str, Any] = {}
+        # Keyed by "<video_id>_<w>x<h>" and by "<bytes digest>_<w>x<h>" so
+        # identical images served for different videos are decoded once
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Downloads are network-latency bound, so several run side by side
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 1) + 4),
+            thread_name_prefix="thumbnail"
+        )
+        self._executor.submit(self._sweep_disk_cache)
+    
+    def _cache_get(self, key: str) -> Optional[Any]:
+        with self._cache_lock:
+            img = self._cache.get(key)
+            if img is not None:
+                self._cache.move_to_end(key)
+            return img
+    
+    def _cache_put(self, img: Any, *keys: str):
+        with self._cache_lock:
+            for key in keys:
+                self._cache[key] = img
+                self._cache.move_to_end(key)
+            while len(self._cache) > self.MAX_CACHE:
+                self._cache.popitem(last=False)
+    
+    def _sweep_disk_cache(self):
+        """Delete disk-cached thumbnails not written in DISK_MAX_AGE_DAYS."""
+        cutoff = time.time() - self.DISK_MAX_AGE_DAYS * 86400
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file() and entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+    
+    def get_thumbnail_async(self, url: str, video_id: str,
+                            size: tuple = (320, 180)) -> Future:
+        """Like get_thumbnail, but returns a Future resolved on a worker thread.
+        
+        Memory-cache hits come back as an already-completed Future.
+        """
+        cached = self._cache_get(f"{video_id}_{size[0]}x{size[1]}")
+        if cached is not None:
+            future = Future()
+            future.set_result(cached)
+            return future
+        return self._executor.submit(self.get_thumbnail, url, video_id, size)
     
     def get_thumbnail(self, url: str, video_id: str, 
                       size: tuple = (320, 180)) -> Optional[Any]:
@@ -2903,19 +3480,21 @@ class ThumbnailManager:
         if not HAS_PIL or not url:
             return None
         
-        cache_key = f"{video_id}_{size[0]}x{size[1]}"
+        size_suffix = f"{size[0]}x{size[1]}"
+        cache_key = f"{video_id}_{size_suffix}"
         
         # Check memory cache
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
         
         # Check disk cache
-        cache_path = self.cache_dir / f"{cache_key}.png"
+        cache_path = self.cache_dir / f"{cache_key}.jpg"
         if cache_path.exists():
             try:
                 img = Image.open(cache_path)
                 ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=size)
-                self._cache[cache_key] = ctk_img
+                self._cache_put(ctk_img, cache_key)
                 return ctk_img
             except Exception:
                 pass
@@ -2925,17 +3504,24 @@ class ThumbnailManager:
             with urllib.request.urlopen(url, timeout=10) as response:
                 img_data = response.read()
             
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.jpg') as tmp:
-                tmp.write(img_data)
-                tmp_path = tmp.name
+            # Same bytes already decoded at this size (e.g. shared default thumbnail)?
+            digest_key = f"{hashlib.blake2b(img_data, digest_size=16).hexdigest()}_{size_suffix}"
+            ctk_img = self._cache_get(digest_key)
+            if ctk_img is not None:
+                self._cache_put(ctk_img, cache_key)
+                return ctk_img
             
-            img = Image.open(tmp_path)
-            img = img.resize(size, Image.Resampling.LANCZOS)
-            img.save(cache_path, "PNG")
-            os.unlink(tmp_path)
+            # Decode straight from memory. draft() lets the JPEG decoder scale
+            # down while decoding; BILINEAR is plenty at thumbnail sizes.
+            img = Image.open(io.BytesIO(img_data))
+            img.draft('RGB', (size[0] * 2, size[1] * 2))
+            img.thumbnail(size, Image.Resampling.BILINEAR)
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+            img.save(cache_path, "JPEG", quality=85)
             
             ctk_img = ctk.CTkImage(light_image=img, dark_image=img, size=size)
-            self._cache[cache_key] = ctk_img
+            self._cache_put(ctk_img, cache_key, digest_key)
             return ctk_img
             
         except Exception as e:
@@ -2944,7 +3530,8 @@ class ThumbnailManager:
     
     def clear_cache(self):
         """Clear thumbnail cache."""
-        self._cache.clear()
+        with self._cache_lock:
+            self._cache.clear()
         try:
             shutil.rmtree(self.cache_dir)
             self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -2956,172 +3543,267 @@ class ThumbnailManager:
 # PROGRESS TRACKING & ETA
 # ============================================================================
 
+# Multipliers replacing per-call divides. The powers of two are exact as
+# floats, so multiplying by the reciprocal gives the same result.
+_INV_KB = 1 / (1 << 10)
+_INV_MB = 1 / (1 << 20)
+_INV_GB = 1 / (1 << 30)
+_INV_MBIT = 8e-6  # bytes -> megabits
+
+# One pattern classifies a raw (undecoded) yt-dlp output line, dispatched on
+# match.lastgroup: download progress (with the speed, when shown, in the same
+# match), v17.7.5 merging/processing messages, or chapter processing
+_YTDLP_LINE_RE = re.compile(
+    rb'(?P<progress>\[download\]\s+(?P<pct>\d+(?:\.\d+)?)%'
+    rb'(?:.*?at\s+(?P<speed>[\d.]+)(?P<unit>Ki|Mi|Gi)?B/s)?)'
+    rb'|(?P<merge>\[(?:Merger|ffmpeg|ExtractAudio|FixupM3u8|Fixup)\]|Merging formats|Destination:.*_temp)'
+    rb'|(?P<chapter>Chapter \d+|Writing chapter)'
+)
+
+# Cheap screen on raw output bytes for lines that may be errors or warnings
+_ERROR_OR_WARNING_RE = re.compile(rb'(?i)error|warning')
+
+# Confusing yt-dlp warnings that don't help users (matched lowercased)
+_YTDLP_SKIP_WARNINGS = (
+    "install ffmpeg",  # We have ffmpeg bundled
+    "dash m4a",        # Related to above
+    "skipped",         # Format skipped warnings
+    "merger",          # Merger warnings handled elsewhere
+    "429",             # Rate limiting - handled by retry
+    "403",             # Forbidden - handled by retry
+)
+
+# ffmpeg stats-line fields (chapter encode, which still reads stderr). ffmpeg
+# prints time= as fixed-width HH:MM:SS.cc, so it is decoded by byte offset.
+_FFMPEG_TIME_RE = re.compile(rb'time=\d\d:\d\d:\d\d\.\d\d')
+_FFMPEG_FPS_RE = re.compile(rb'fps=\s*(\d+(?:\.\d+)?)')
+_FFMPEG_SPEED_RE = re.compile(rb'speed=\s*(\d+(?:\.\d+)?)x')
+
+# yt-dlp speed unit prefix (b"" for plain B/s) -> megabits per second per unit
+_SPEED_MBPS = {
+    b"": _INV_MBIT,
+    b"Ki": 1024 * _INV_MBIT,
+    b"Mi": 1024 * 1024 * _INV_MBIT,
+    b"Gi": 1024 * 1024 * 1024 * _INV_MBIT,
+}
+
+# (multiplier, format) for file sizes, indexed by (bit_length - 1) // 10
+_FILE_SIZE_UNITS = (
+    (1, "{} B"),
+    (_INV_KB, "{:.1f} KB"),
+    (_INV_MB, "{:.1f} MB"),
+    (_INV_GB, "{:.2f} GB"),
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _format_eta_seconds(seconds: int) -> str:
+    """Format a whole number of seconds as "45s", "3m 12s" or "1h 5m"."""
+    if seconds < 60:
+        return f"{seconds}s"
+    elif seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60}s"
+    return f"{seconds // 3600}h {seconds % 3600 // 60}m"
+
+
+def _format_size(size_bytes: int) -> str:
+    """Format a byte count as B, KB, MB or GB."""
+    # Not cached: callers pass the exact size of a growing file, so a key
+    # would almost never repeat
+    if size_bytes < 1024:
+        return f"{size_bytes} B"
+    # Each unit spans 10 bits, so bit_length() picks the row directly
+    idx = min((size_bytes.bit_length() - 1) // 10, 3)
+    multiplier, fmt = _FILE_SIZE_UNITS[idx]
+    return fmt.format(size_bytes * multiplier)
+
+
+class ProgressSnapshot(NamedTuple):
+    """Everything the UI needs from one ProgressTracker.tick()."""
+    eta: Optional[float]  # Seconds, or None while still calculating
+    eta_text: str
+
+
 class ProgressTracker:
-    """Tracks download/conversion progress for accurate ETA calculation."""
+    """
+    Tracks download/conversion progress for accurate ETA calculation.
     
-    def __init__(self, window_size=15):
-        self.window_size = window_size  # Seconds for sliding window
-        self.history = []  # List of (timestamp, percentage) tuples
-        self.start_time = None
+    Timestamps are integer time.monotonic_ns() values; callers that pass
+    `now` must use the same clock. Durations are converted to seconds only
+    where a rate or a duration leaves the tracker.
+    """
+    
+    # One tracker is read and written on every progress line; slots keep
+    # attribute access off the instance dict
+    __slots__ = (
+        'window_size', '_rate_ewma', '_last_sample', '_eta_value', '_eta_dirty',
+        '_eta_time',
+        'start_time', 'current_stage', '_time', '_exp',
+    )
+    
+    # Shortest gap between ETA recomputations; progress lines arrive far more
+    # often than the label can usefully change
+    ETA_MIN_INTERVAL_NS = 500_000_000
+    
+    def __init__(self, window_size: float = 15):
+        self.window_size = window_size  # Seconds; time constant of the rate average
+        # Progress rate (% per second) as an exponentially weighted moving
+        # average, updated per sample, so no sample history is kept
+        self._rate_ewma: Optional[float] = None
+        self._last_sample: Optional[Tuple[int, float]] = None  # (timestamp_ns, percentage)
+        # get_eta() result, recomputed only after update() has run since
+        # and at most once per ETA_MIN_INTERVAL_NS
+        self._eta_value: Optional[float] = None
+        self._eta_dirty = False
+        self._eta_time = 0  # monotonic ns of the last recomputation
+        self.start_time: Optional[int] = None
         self.current_stage = "idle"
-        self.download_speed = None  # Mbps
-        self.conversion_fps = None
-        # v17.7.5: Stall detection
-        self.last_progress_time = None
-        self.last_progress_value = 0
-        self.stall_threshold = 5  # Seconds before considering progress stalled
-        self.is_stalled = False
-        # v17.7.5: File monitoring
-        self.monitored_file = None
-        self.last_file_size = 0
-        self.file_growth_rate = 0  # bytes per second
-        
-    def start(self, stage="downloading"):
+        # Module functions used on every tick, bound once so the hot paths
+        # read an instance attribute instead of a global plus an attribute
+        self._time = time.monotonic_ns
+        self._exp = math.exp
+        
+    def _now(self, now: Optional[int] = None) -> int:
+        """Return now, or the current time if the caller did not pass one."""
+        return self._time() if now is None else now
+        
+    def start(self, stage: str = "downloading", now: Optional[int] = None) -> None:
         """Start tracking a new stage."""
-        self.start_time = time.time()
-        self.history = []
+        now = self._now(now)
+        self.start_time = now
+        self._rate_ewma = None
+        self._last_sample = None
+        self._eta_value = None
+        self._eta_dirty = False
+        self._eta_time = 0
         self.current_stage = stage
-        self.download_speed = None
-        self.conversion_fps = None
-        self.last_progress_time = time.time()
-        self.last_progress_value = 0
-        self.is_stalled = False
-        self.monitored_file = None
-        self.last_file_size = 0
-        self.file_growth_rate = 0
-        
-    def update(self, percentage):
+        
+    def update(self, percentage: float, now: Optional[int] = None) -> None:
         """Update progress percentage."""
+        current_time = self._time() if now is None else now
         if self.start_time is None:
-            self.start()
-            
-        current_time = time.time()
-        self.history.append((current_time, percentage))
-        
-        # Keep only last window_size seconds
-        cutoff_time = current_time - self.window_size
-        self.history = [(t, p) for t, p in self.history if t >= cutoff_time]
-        
-        # v17.7.5: Update stall detection
-        if percentage > self.last_progress_value:
-            self.last_progress_time = current_time
-            self.last_progress_value = percentage
-            self.is_stalled = False
+            self.start(now=current_time)
+            
+        last = self._last_sample
+        if last is not None and current_time > last[0]:
+            dt = (current_time - last[0]) * 1e-9  # Seconds
+            instant_rate = (percentage - last[1]) / dt
+            if self._rate_ewma is None:
+                self._rate_ewma = instant_rate
+            else:
+                # Weight by elapsed time so bursty updates don't skew the average
+                alpha = 1 - self._exp(-dt / self.window_size)
+                self._rate_ewma += alpha * (instant_rate - self._rate_ewma)
+        if last is None or current_time != last[0]:
+            self._last_sample = (current_time, percentage)
+        self._eta_dirty = True
+    
+    def tick(self, percentage: Optional[float] = None,
+             now: Optional[int] = None) -> ProgressSnapshot:
+        """Record progress (if given) and return the ETA against a single clock read."""
+        now = self._now(now)
+        if percentage is not None:
+            self.update(percentage, now=now)
+        return ProgressSnapshot(self.get_eta(now=now), self.format_eta(now=now))
+    
+    def get_eta(self, now: Optional[int] = None) -> Optional[float]:
+        """Calculate ETA in seconds from the smoothed progress rate."""
+        if not self._eta_dirty:
+            return self._eta_value
+        now = self._now(now)
+        if self._eta_value is not None and now - self._eta_time < self.ETA_MIN_INTERVAL_NS:
+            return self._eta_value
+        self._eta_dirty = False
+        self._eta_time = now
+        rate = self._rate_ewma  # % per second
+        if rate is None or rate <= 0:
+            self._eta_value = None
+        else:
+            self._eta_value = (100 - self._last_sample[1]) / rate
+        return self._eta_value
     
-    def check_stall(self) -> bool:
-        """Check if progress appears stalled (no updates for threshold seconds)."""
-        if self.last_progress_time is None:
-            return False
-        time_since_progress = time.time() - self.last_progress_time
-        self.is_stalled = time_since_progress > self.stall_threshold
-        return self.is_stalled
+    def format_eta(self, now: Optional[int] = None) -> str:
+        """Format ETA as human-readable string."""
+        eta = self.get_eta(now=now)
+        if eta is None or eta <= 0:
+            return "calculating..."
+        # Only whole seconds are shown, so the cache is keyed on int(eta)
+        return _format_eta_seconds(int(eta))
     
-    def get_stall_duration(self) -> float:
-        """Get how long progress has been stalled."""
-        if self.last_progress_time is None:
-            return 0
-        return time.time() - self.last_progress_time
+    def format_file_size(self, size_bytes: int) -> str:
+        """Format file size as human-readable string."""
+        return _format_size(size_bytes)
+
+
+class ProgressPollService:
+    """
+    One daemon thread that runs the downloads' output-file watchers
+    (watch()), sharing a single clock read per pass, so any number of running
+    tasks share this one thread instead of each starting a polling thread of
+    its own.
+    """
     
-    def set_monitored_file(self, filepath: str):
-        """Set a file to monitor for growth (used when progress parsing fails)."""
-        self.monitored_file = filepath
-        self.last_file_size = 0
-        
-    def check_file_growth(self) -> tuple[bool, int, float]:
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval  # Seconds between passes
+        self._watches: "set[Callable[[int], bool]]" = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def _ensure_thread(self):
+        """Start the polling thread if needed (call with _lock held)."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="progress-poll", daemon=True
+            )
+            self._thread.start()
+    
+    def watch(self, callback: Callable[[int], bool]):
         """
-        Check if the monitored file is growing.
-        Returns: (is_growing, current_size, growth_rate_mbps)
+        Call callback(now) once per pass, with now from time.monotonic_ns(),
+        until it is unwatched or returns False. Starts the thread on first use.
         """
-        if not self.monitored_file or not os.path.exists(self.monitored_file):
-            return False, 0, 0
-        
-        try:
-            current_size = os.path.getsize(self.monitored_file)
-            current_time = time.time()
-            
-            if self.last_file_size > 0 and hasattr(self, '_last_size_check_time'):
-                time_delta = current_time - self._last_size_check_time
-                if time_delta > 0:
-                    size_delta = current_size - self.last_file_size
-                    # Convert bytes/sec to Mbps (megabits per second)
-                    self.file_growth_rate = (size_delta * 8) / (time_delta * 1_000_000)
-            
-            self._last_size_check_time = current_time
-            is_growing = current_size > self.last_file_size
-            self.last_file_size = current_size
-            
-            return is_growing, current_size, self.file_growth_rate
-        except Exception:
-            return False, 0, 0
+        with self._lock:
+            self._watches.add(callback)
+            self._ensure_thread()
     
-    def get_eta(self):
-        """Calculate ETA in seconds using sliding window."""
-        if len(self.history) < 2:
-            return None
-            
-        # Get oldest and newest in window
-        oldest_time, oldest_pct = self.history[0]
-        newest_time, newest_pct = self.history[-1]
-        
-        time_delta = newest_time - oldest_time
-        progress_delta = newest_pct - oldest_pct
-        
-        if time_delta == 0 or progress_delta <= 0:
-            return None
-            
-        # Calculate rate and remaining time
-        rate = progress_delta / time_delta  # % per second
-        remaining_pct = 100 - newest_pct
-        eta_seconds = remaining_pct / rate if rate > 0 else None
-        
-        return eta_seconds
+    def unwatch(self, callback: Callable[[int], bool]):
+        """Stop calling callback (no-op if it is not watched)."""
+        with self._lock:
+            self._watches.discard(callback)
     
-    def format_eta(self):
-        """Format ETA as human-readable string."""
-        eta = self.get_eta()
-        if eta is None or eta <= 0:
-            return "calculating..."
-            
-        if eta < 60:
-            return f"{int(eta)}s"
-        elif eta < 3600:
-            mins = int(eta / 60)
-            secs = int(eta % 60)
-            return f"{mins}m {secs}s"
-        else:
-            hours = int(eta / 3600)
-            mins = int((eta % 3600) / 60)
-            return f"{hours}h {mins}m"
-    
-    def set_download_speed(self, speed_mbps):
-        """Set download speed in Mbps."""
-        self.download_speed = speed_mbps
-    
-    def set_conversion_fps(self, fps):
-        """Set conversion FPS."""
-        self.conversion_fps = fps
-    
-    def format_speed(self):
-        """Format download speed."""
-        if self.download_speed is None:
-            return ""
-        return f"{self.download_speed:.1f} Mbps"
-    
-    def format_fps(self):
-        """Format conversion FPS."""
-        if self.conversion_fps is None:
-            return ""
-        return f"{self.conversion_fps:.0f} fps"
+    def stop(self):
+        """Stop the polling thread."""
+        self._stop.set()
     
-    def format_file_size(self, size_bytes: int) -> str:
-        """Format file size as human-readable string."""
-        if size_bytes >= 1024 ** 3:
-            return f"{size_bytes / (1024 ** 3):.2f} GB"
-        elif size_bytes >= 1024 ** 2:
-            return f"{size_bytes / (1024 ** 2):.1f} MB"
-        elif size_bytes >= 1024:
-            return f"{size_bytes / 1024:.1f} KB"
-        return f"{size_bytes} B"
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                watches = list(self._watches)
+            if not watches:
+                # Nothing to poll: no clock read
+                continue
+            now = time.monotonic_ns()
+            for callback in watches:
+                try:
+                    keep = callback(now)
+                except Exception:
+                    keep = True
+                if keep is False:
+                    self.unwatch(callback)
+
+
+_poll_service: Optional[ProgressPollService] = None
+_poll_service_lock = threading.Lock()
+
+
+def get_progress_poll_service() -> ProgressPollService:
+    """Shared ProgressPollService for the process, created on first use."""
+    global _poll_service
+    with _poll_service_lock:
+        if _poll_service is None:
+            _poll_service = ProgressPollService()
+        return _poll_service
 
 
 # ============================================================================
@@ -3131,19 +3813,38 @@ class ProgressTracker:
 class DownloadManager:
     """Manages download queue and operations."""
     
-    def __init__(self, ytdlp: YtDlpInterface, output_dir: str):
+    TASK_NOTIFY_INTERVAL_NS = 100_000_000  # 10 progress updates per second
+    
+    def __init__(self, ytdlp: YtDlpInterface, output_dir: str,
+                 history_mgr: Optional["HistoryManager"] = None):
         self.ytdlp = ytdlp
         self.output_dir = output_dir
-        self.queue: List[DownloadTask] = []
+        # Finished downloads are recorded through the app's one history connection
+        self.history_mgr = history_mgr if history_mgr is not None else HistoryManager(HISTORY_DB_PATH)
+        # All tasks, for UI iteration. Only changed by single append()/remove()
+        # calls, each atomic under the GIL, so no lock is needed; iterate a
+        # list() snapshot
+        self.queue: Deque[DownloadTask] = deque()
+        # Tasks waiting to run, in order; the worker blocks on this instead of
+        # polling and scanning self.queue
+        self._pending: "queue.SimpleQueue[DownloadTask]" = queue.SimpleQueue()
         self.current_task: Optional[DownloadTask] = None
         self.current_process: Optional[subprocess.Popen] = None
+        # The audio stream downloads alongside the video on its own worker
+        self.background_process: Optional[subprocess.Popen] = None
+        self._stream_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audio-download")
+        # Set to stop the current task's audio retry loop (new Event per task)
+        self._audio_abort = threading.Event()
         self._running = False
-        self._paused = False
-        self._lock = threading.Lock()
+        # Set while running, cleared while paused; workers block in wait()
+        self._pause_event = threading.Event()
+        self._pause_event.set()
         self._callbacks: List[Callable] = []
+        # Last delivered task_updated: (task id, status, status detail) and when
+        self._last_task_state: Optional[Tuple[str, DownloadStatus, Optional[str]]] = None
+        self._last_task_notify = 0
         self.progress_tracker = ProgressTracker(window_size=15)  # NEW: Progress tracking with ETA
         # Load settings for SponsorBlock support
-        from pathlib import Path as PathLib
         self.settings_mgr = SettingsManager(SETTINGS_PATH)
     
     def _get_cookie_args(self) -> List[str]:
@@ -3159,9 +3860,8 @@ class DownloadManager:
             - firefox:yt-downloader
             - edge:Default
         """
-        # Reload settings from disk to get latest values
-        # (user may have changed settings after app started)
-        self.settings_mgr = SettingsManager(SETTINGS_PATH)
+        # Pick up settings changed since the app started (cheap when unchanged)
+        self.settings_mgr.reload_if_changed()
         
         if self.settings_mgr.get("use_browser_cookies", False):
             browser = self.settings_mgr.get("cookies_browser", "chrome")
@@ -3182,8 +3882,21 @@ class DownloadManager:
         """Add a callback for status updates."""
         self._callbacks.append(callback)
     
-    def _notify(self, event: str, data: Any = None):
-        """Notify all callbacks."""
+    def _notify(self, event: str, data: Any = None, force: bool = False):
+        """Notify all callbacks.
+        
+        "task_updated" fires on every progress line, far faster than the UI
+        redraws, so it is delivered at most once per TASK_NOTIFY_INTERVAL_NS
+        unless forced or the task's status or status detail changed.
+        """
+        if event == "task_updated" and not force:
+            now = time.monotonic_ns()
+            state = (data.id, data.status, data.status_detail)
+            if (state == self._last_task_state
+                    and now - self._last_task_notify < self.TASK_NOTIFY_INTERVAL_NS):
+                return
+            self._last_task_state = state
+            self._last_task_notify = now
         for cb in self._callbacks:
             try:
                 cb(event, data)
@@ -3201,16 +3914,26 @@ class DownloadManager:
             trim_end=trim_end,
         )
         
-        with self._lock:
-            self.queue.append(task)
+        self.queue.append(task)
+        self._pending.put(task)
         
         self._notify("task_added", task)
         return task
     
     def remove_task(self, task_id: str):
         """Remove a task from the queue."""
-        with self._lock:
-            self.queue = [t for t in self.queue if t.id != task_id]
+        # Iterate a snapshot and remove in place; add_task may append from
+        # another thread, and swapping in a new deque could drop that task
+        for t in list(self.queue):
+            if t.id != task_id:
+                continue
+            # Still in _pending; the worker skips anything no longer QUEUED
+            if t.status == DownloadStatus.QUEUED:
+                t.status = DownloadStatus.CANCELLED
+            try:
+                self.queue.remove(t)
+            except ValueError:
+                pass  # Already removed
         self._notify("task_removed", task_id)
     
     def start(self):
@@ -3219,48 +3942,77 @@ class DownloadManager:
             return
         
         self._running = True
-        self._paused = False
+        self._pause_event.set()
         threading.Thread(target=self._process_queue, daemon=True).start()
     
     def pause(self):
         """Pause queue processing."""
-        self._paused = True
+        self._pause_event.clear()
         if self.current_task:
             self.current_task.status = DownloadStatus.PAUSED
             self._notify("task_updated", self.current_task)
     
     def resume(self):
         """Resume queue processing."""
-        self._paused = False
+        self._pause_event.set()
         if self.current_task:
             self.current_task.status = DownloadStatus.DOWNLOADING
             self._notify("task_updated", self.current_task)
     
+    @staticmethod
+    def _signal_process_group(process: subprocess.Popen, sig: int) -> None:
+        """Send sig to a download process and its children (its own group)."""
+        # Once the leader has been reaped its pid (the group id) may be reused
+        if process.poll() is not None:
+            return
+        try:
+            os.killpg(process.pid, sig)
+        except (ProcessLookupError, PermissionError):
+            pass  # Group already gone
+    
+    def _stop_process(self, process: subprocess.Popen, timeout: float = 5) -> None:
+        """Terminate a download's process group, escalating to SIGKILL."""
+        self._signal_process_group(process, signal.SIGTERM)
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self._signal_process_group(process, signal.SIGKILL)
+            process.wait()
+    
     def cancel_current(self):
         """Cancel the current download."""
-        if self.current_process:
-            self.current_process.terminate()
+        # Stop the audio retry loop first so it doesn't restart yt-dlp
+        self._audio_abort.set()
+        for process in (self.current_process, self.background_process):
+            if process:
+                self._signal_process_group(process, signal.SIGTERM)
         if self.current_task:
             self.current_task.status = DownloadStatus.CANCELLED
             self._notify("task_updated", self.current_task)
     
+    def shutdown(self, timeout: float = 5):
+        """
+        Stop the queue and kill any running yt-dlp/ffmpeg process groups, so
+        no download outlives the app (they run in their own sessions).
+        """
+        self._running = False
+        self._pause_event.set()  # Let a paused worker see _running
+        self._audio_abort.set()
+        for process in (self.current_process, self.background_process):
+            if process:
+                self._stop_process(process, timeout)
+    
     def _process_queue(self):
         """Process downloads in the queue."""
         while self._running:
-            if self._paused:
-                time.sleep(0.5)
-                continue
+            self._pause_event.wait()
             
-            # Get next task
-            task = None
-            with self._lock:
-                for t in self.queue:
-                    if t.status == DownloadStatus.QUEUED:
-                        task = t
-                        break
-            
-            if not task:
-                time.sleep(0.5)
+            # Get next task (blocks; the timeout only re-checks _running and pause)
+            try:
+                task = self._pending.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if task.status != DownloadStatus.QUEUED:
                 continue
             
             self.current_task = task
@@ -3272,6 +4024,10 @@ class DownloadManager:
         task.status = DownloadStatus.DOWNLOADING
         task.started_at = datetime.now()
         self._notify("task_updated", task)
+        # One settings read per task; later lookups hit this dict, not the file
+        cfg = self.settings_mgr.snapshot()
+        audio_future: Optional[Future] = None
+        audio_abort = self._audio_abort = threading.Event()
         
         try:
             video_info = task.video_info
@@ -3360,6 +4116,51 @@ class DownloadManager:
             
             video_cmd = self.ytdlp._build_command(video_cmd_args)
             
+            # Step 2 (concurrent): Download best audio (prefer AAC for QuickTime compatibility)
+            # v18.1.4: Removed extractor-args, added cookie support for 403 bypass
+            audio_cmd = self.ytdlp._build_command([
+                "--newline",
+                "--ffmpeg-location", FFMPEG_PATH.rsplit('/', 1)[0],  # Tell yt-dlp where ffmpeg is
+                "--no-continue",  # Start fresh on retry
+                "--force-overwrites",
+            ] + cookie_args + trim_args + [
+                "-f", "bestaudio[acodec^=mp4a][ext=m4a]/bestaudio[ext=m4a]/bestaudio/best",
+                "-o", temp_audio,
+                video_info.url
+            ])
+            
+            # Video (0-40%) and audio (40-60%) are independent streams, so they
+            # download side by side; task.progress is the sum of both shares
+            stream_progress = {"Downloading video": 0.0, "Downloading audio": 0.0}
+            
+            def download_audio() -> Optional[str]:
+                """Audio retry loop; returns None on success or the last error."""
+                error = None
+                try:
+                    for attempt in range(RETRY_MAX_ATTEMPTS):
+                        error = self._run_subprocess_with_progress(
+                            audio_cmd, task, "Downloading audio", 40, 60, f"{video_id}_temp_audio",
+                            shared_progress=stream_progress, background=True
+                        )
+                        if error is None or audio_abort.is_set():
+                            return error
+                        
+                        if attempt < RETRY_MAX_ATTEMPTS - 1:
+                            delay = get_retry_delay(attempt)
+                            
+                            if attempt >= RETRY_SILENT_THRESHOLD:
+                                self._notify("log", ("warning", f"⚠️ YouTube blocked audio request - retrying in {delay}s ({attempt + 1}/{RETRY_MAX_ATTEMPTS - 1})..."))
+                            
+                            if audio_abort.wait(delay):
+                                return error
+                    return error
+                finally:
+                    task.audio_downloading = False
+            
+            # Set before submitting so the UI never sees the audio as not started
+            task.audio_downloading = True
+            audio_future = self._stream_executor.submit(download_audio)
+            
             # Track if we've tried the fallback format
             tried_fallback = False
             
@@ -3369,7 +4170,8 @@ class DownloadManager:
                 # v18.1.4: Clean up partial files before each attempt
                 # This prevents "format not available" errors from stale .part files
                 if attempt > 0:
-                    self._cleanup_partial_files(self.output_dir, video_id)
+                    # Leave the audio download running alongside untouched
+                    self._cleanup_partial_files(self.output_dir, video_id, stream="temp_video")
                     
                     # v18.5.0: After FIRST failure with specific format ID, immediately try generic format
                     # YouTube often blocks specific format IDs but allows generic selection
@@ -3392,10 +4194,15 @@ class DownloadManager:
                         ]
                         video_cmd = self.ytdlp._build_command(fallback_cmd_args)
                 
-                self._run_subprocess_with_progress(video_cmd, task, "Downloading video", 0, 40, f"{video_id}_temp_video")
+                error = self._run_subprocess_with_progress(
+                    video_cmd, task, "Downloading video", 0, 40, f"{video_id}_temp_video",
+                    shared_progress=stream_progress
+                )
                 
-                if task.status != DownloadStatus.FAILED:
+                if error is None:
                     break
+                task.status = DownloadStatus.FAILED
+                task.error_message = error
                     
                 if attempt < RETRY_MAX_ATTEMPTS - 1:
                     # Get delay for this retry
@@ -3405,8 +4212,7 @@ class DownloadManager:
                     if attempt >= RETRY_SILENT_THRESHOLD:
                         self._notify("log", ("warning", f"⚠️ YouTube blocked this request - retrying in {delay}s ({attempt + 1}/{RETRY_MAX_ATTEMPTS - 1})..."))
                         # Check if cookies are enabled
-                        self.settings_mgr = SettingsManager(SETTINGS_PATH)
-                        if not self.settings_mgr.get("use_browser_cookies", False):
+                        if not cfg.get("use_browser_cookies", False):
                             self._notify("log", ("info", "💡 Tip: Enable browser cookies in Settings → Cookies for better success"))
                     
                     task.status = DownloadStatus.DOWNLOADING  # Reset status for retry
@@ -3427,8 +4233,7 @@ class DownloadManager:
                         self._notify("log", ("info", ""))
                         
                         # Check if cookies are already enabled
-                        self.settings_mgr = SettingsManager(SETTINGS_PATH)
-                        cookies_enabled = self.settings_mgr.get("use_browser_cookies", False)
+                        cookies_enabled = cfg.get("use_browser_cookies", False)
                         
                         if not cookies_enabled:
                             self._notify("log", ("warning", "✅ FIX #1: Enable Browser Cookies (RECOMMENDED)"))
@@ -3476,85 +4281,26 @@ class DownloadManager:
                 video_file = self._find_temp_file(self.output_dir, f"{video_id}_temp_video")
             
             if not video_file:
-                self._notify("log", ("warning", "Still not found, searching by video_id..."))
-                # Log all files in directory for debugging
-                try:
-                    all_files = os.listdir(self.output_dir)
-                    matching_files = [f for f in all_files if video_id in f]
-                    self._notify("log", ("info", f"Files with video_id in name: {matching_files}"))
-                except Exception as e:
-                    self._notify("log", ("error", f"Error listing directory: {e}"))
-                
                 # Search more broadly - any file with video_id that looks like video
-                for fname in os.listdir(self.output_dir):
-                    if video_id in fname and '_temp_audio' not in fname:
-                        # Check various video extensions
-                        if fname.endswith(('.mp4', '.webm', '.mkv', '.f137.mp4', '.f313.webm', '.f271.webm')):
-                            fpath = os.path.join(self.output_dir, fname)
-                            try:
-                                fsize = os.path.getsize(fpath)
-                                if fsize > 1000:  # At least 1KB
-                                    video_file = fpath
-                                    self._notify("log", ("info", f"Found video file: {fname} ({fsize} bytes)"))
-                                    break
-                            except:
-                                pass
-            
-            # Last resort: look for any recently modified video file with video_id
-            if not video_file:
-                self._notify("log", ("warning", "Trying last resort search..."))
-                import glob
-                patterns = [
-                    os.path.join(self.output_dir, f"*{video_id}*.mp4"),
-                    os.path.join(self.output_dir, f"*{video_id}*.webm"),
-                    os.path.join(self.output_dir, f"*{video_id}*.mkv"),
-                ]
-                for pattern in patterns:
-                    matches = glob.glob(pattern)
-                    for match in matches:
-                        if '_temp_audio' not in match and os.path.getsize(match) > 1000:
-                            video_file = match
-                            self._notify("log", ("info", f"Found via glob: {os.path.basename(match)}"))
-                            break
-                    if video_file:
-                        break
+                self._notify("log", ("warning", "Still not found, searching by video_id..."))
+                video_file = self._find_file_by_video_id(
+                    video_id, ('.mp4', '.webm', '.mkv'), '_temp_audio', min_size=1000  # At least 1KB
+                )
             
             if not video_file:
                 task.status = DownloadStatus.FAILED
                 task.error_message = "Video file not found after download"
                 return
             
-            # Step 2: Download best audio (prefer AAC for QuickTime compatibility)
-            # v18.1.4: Removed extractor-args, added cookie support for 403 bypass
-            audio_cmd = self.ytdlp._build_command([
-                "--newline",
-                "--ffmpeg-location", FFMPEG_PATH.rsplit('/', 1)[0],  # Tell yt-dlp where ffmpeg is
-                "--no-continue",  # Start fresh on retry
-                "--force-overwrites",
-            ] + cookie_args + trim_args + [
-                "-f", "bestaudio[acodec^=mp4a][ext=m4a]/bestaudio[ext=m4a]/bestaudio/best",
-                "-o", temp_audio,
-                video_info.url
-            ])
-            
-            # Try audio download with unified retry logic
-            for attempt in range(RETRY_MAX_ATTEMPTS):
-                self._run_subprocess_with_progress(audio_cmd, task, "Downloading audio", 40, 60, f"{video_id}_temp_audio")
-                
-                if task.status != DownloadStatus.FAILED:
-                    break
-                    
-                if attempt < RETRY_MAX_ATTEMPTS - 1:
-                    delay = get_retry_delay(attempt)
-                    
-                    if attempt >= RETRY_SILENT_THRESHOLD:
-                        self._notify("log", ("warning", f"⚠️ YouTube blocked audio request - retrying in {delay}s ({attempt + 1}/{RETRY_MAX_ATTEMPTS - 1})..."))
-                    
-                    task.status = DownloadStatus.DOWNLOADING
-                    task.status_detail = f"YouTube blocked - retry in {delay}s..."
-                    self._notify("task_updated", task)
-                    time.sleep(delay)
-                    task.status_detail = None
+            # Wait for the audio stream started alongside the video
+            if not audio_future.done():
+                task.status_detail = "Finishing audio download..."
+                self._notify("task_updated", task)
+            audio_error = audio_future.result()
+            task.status_detail = None
+            if audio_error is not None:
+                task.status = DownloadStatus.FAILED
+                task.error_message = audio_error
             
             if task.status == DownloadStatus.FAILED:
                 self._notify("log", ("error", f"Œ Audio download failed after {RETRY_MAX_ATTEMPTS} attempts"))
@@ -3574,19 +4320,11 @@ class DownloadManager:
                 audio_file = self._find_temp_file(self.output_dir, f"{video_id}_temp_audio", is_audio=True)
             
             if not audio_file:
+                # Search for any audio file containing the video_id that has content
                 self._notify("log", ("warning", "Still not found, searching by video_id..."))
-                # Search for any audio file containing the video_id
-                audio_extensions = ('.m4a', '.webm', '.opus', '.mp3', '.ogg', '.aac', '.mp4')
-                for fname in os.listdir(self.output_dir):
-                    if video_id in fname and fname.endswith(audio_extensions):
-                        # Skip files that look like video (contain _temp_video)
-                        if '_temp_video' not in fname:
-                            fpath = os.path.join(self.output_dir, fname)
-                            # Make sure file has content
-                            if os.path.getsize(fpath) > 0:
-                                audio_file = fpath
-                                self._notify("log", ("info", f"Found audio file: {fname}"))
-                                break
+                audio_file = self._find_file_by_video_id(
+                    video_id, ('.m4a', '.webm', '.opus', '.mp3', '.ogg', '.aac', '.mp4'), '_temp_video'
+                )
             
             if not audio_file:
                 task.status = DownloadStatus.FAILED
@@ -3598,13 +4336,10 @@ class DownloadManager:
             self._notify("task_updated", task)
             
             # ENHANCEMENT v16.1: Smart per-resolution bitrate selection
-            from pathlib import Path as PathLib
-            settings_mgr = SettingsManager(SETTINGS_PATH)
-            
-            encoder_type = settings_mgr.get("encoder_type", "auto")
-            encoder_preset = settings_mgr.get("encoder_preset", "medium")
-            bitrate_mode = settings_mgr.get("bitrate_mode", "auto")
-            audio_bitrate = settings_mgr.get("audio_bitrate", 192)
+            encoder_type = cfg.get("encoder_type", "auto")
+            encoder_preset = cfg.get("encoder_preset", "medium")
+            bitrate_mode = cfg.get("bitrate_mode", "auto")
+            audio_bitrate = cfg.get("audio_bitrate", 192)
             
             # Determine video codec
             if encoder_type == "cpu":
@@ -3612,7 +4347,13 @@ class DownloadManager:
             elif encoder_type == "gpu":
                 video_codec = "h264_videotoolbox"
             else:  # auto
-                video_codec = "h264_videotoolbox"  # Try GPU first
+                # Use the GPU when this ffmpeg has VideoToolbox, instead of
+                # discovering its absence by failing a whole encode
+                encoders = ffmpeg_encoders(FFMPEG_PATH)
+                if encoders is None or "h264_videotoolbox" in encoders:
+                    video_codec = "h264_videotoolbox"
+                else:
+                    video_codec = "libx264"
             
             # Calculate video bitrate based on mode and resolution
             video_height = fmt.height if fmt else None
@@ -3623,49 +4364,33 @@ class DownloadManager:
                 self._notify("log", ("info", source_info))
             
             if bitrate_mode == "per_resolution":
-                per_res = settings_mgr.get("per_resolution_bitrates", {
+                per_res = cfg.get("per_resolution_bitrates", {
                     "2160": "45", "1440": "20", "1080": "8", "720": "5", "480": "2"
                 })
                 if video_height:
-                    if video_height >= 2160:
-                        video_bitrate = f"{per_res.get('2160', '45')}M"
-                    elif video_height >= 1440:
-                        video_bitrate = f"{per_res.get('1440', '20')}M"
-                    elif video_height >= 1080:
-                        video_bitrate = f"{per_res.get('1080', '8')}M"
-                    elif video_height >= 720:
-                        video_bitrate = f"{per_res.get('720', '5')}M"
-                    else:
-                        video_bitrate = f"{per_res.get('480', '2')}M"
+                    # Unset tiers fall back to the auto value for that height
+                    video_bitrate = next(
+                        f"{per_res.get(key, auto_bitrate[:-1])}M"
+                        for min_height, key, auto_bitrate in _BITRATE_TIERS
+                        if video_height >= min_height
+                    )
                 else:
                     video_bitrate = "8M"
             elif bitrate_mode == "custom":
-                video_bitrate = settings_mgr.get("video_bitrate", "8M")
+                video_bitrate = cfg.get("video_bitrate", "8M")
                 if not video_bitrate.endswith(('M', 'm', 'K', 'k')):
                     video_bitrate = f"{video_bitrate}M"
             else:  # auto mode - use higher bitrates for H.264 (less efficient than VP9)
                 if video_height:
-                    if video_height >= 2160:
-                        video_bitrate = "45M"  # 4K needs ~45Mbps for H.264 to match VP9 quality
-                    elif video_height >= 1440:
-                        video_bitrate = "20M"  # 1440p
-                    elif video_height >= 1080:
-                        video_bitrate = "8M"   # 1080p
-                    elif video_height >= 720:
-                        video_bitrate = "5M"   # 720p
-                    else:
-                        video_bitrate = "2M"
+                    video_bitrate = next(
+                        auto_bitrate for min_height, _, auto_bitrate in _BITRATE_TIERS
+                        if video_height >= min_height
+                    )
                 else:
                     video_bitrate = "8M"
             
             # Calculate buffer size
-            try:
-                bitrate_num = float(video_bitrate.rstrip('MmKk'))
-                maxrate = video_bitrate
-                bufsize = f"{int(bitrate_num * 2)}M"
-            except:
-                maxrate = "10M"
-                bufsize = "16M"
+            maxrate, bufsize = _rate_control(video_bitrate)
             
             # Log the bitrate being used
             self._notify("log", ("info", f"Using video bitrate: {video_bitrate}, maxrate: {maxrate}, bufsize: {bufsize}"))
@@ -3674,11 +4399,15 @@ class DownloadManager:
             # Use ffmpeg (which is bundled) instead of ffprobe
             source_width = None
             source_height = None
+            source_vcodec = None
+            source_acodec = None
             try:
-                # Use ffmpeg to get video dimensions (ffmpeg can probe files too)
+                # Use ffmpeg to get video dimensions (ffmpeg can probe files too);
+                # the audio file is probed in the same call for its codec
                 probe_cmd = [
                     FFMPEG_PATH,
                     "-i", video_file,
+                    "-i", audio_file,
                     "-hide_banner"
                 ]
                 # ffmpeg outputs info to stderr when no output specified
@@ -3696,6 +4425,12 @@ class DownloadManager:
                 import re
                 stderr_output = probe_result.stderr
                 
+                # Codecs of the first video stream of input 0 and audio stream of input 1
+                vcodec_match = re.search(r'Stream #0:\d+.*?: Video: (\w+)', stderr_output)
+                acodec_match = re.search(r'Stream #1:\d+.*?: Audio: (\w+)', stderr_output)
+                source_vcodec = vcodec_match.group(1) if vcodec_match else None
+                source_acodec = acodec_match.group(1) if acodec_match else None
+                
                 # Find all video stream lines and extract resolutions
                 # Pattern matches "Video: codec, WIDTHxHEIGHT" with various formats
                 video_stream_pattern = r'Video:.*?(\d{3,5})x(\d{3,5})'
@@ -3741,77 +4476,116 @@ class DownloadManager:
                     # Resolution matches or is higher - good
                     self._notify("log", ("info", f"Source resolution verified: {source_width}x{source_height}"))
             
-            # Build ffmpeg command - merge video and audio
-            ffmpeg_cmd = [
-                FFMPEG_PATH,
-                "-y",
-                "-i", video_file,
-                "-i", audio_file,
-                "-map", "0:v:0",
-                "-map", "1:a:0",
-                "-c:v", video_codec,
-            ]
-            
-            # Add preset for CPU encoding
-            if video_codec == "libx264":
-                ffmpeg_cmd.extend(["-preset", encoder_preset])
-            
-            # CRITICAL: Explicitly set output resolution to match source
-            # This prevents VideoToolbox from defaulting to lower resolution
-            if source_width and source_height:
-                ffmpeg_cmd.extend(["-s", f"{source_width}x{source_height}"])
-            
-            # Add bitrate and encoding params
-            ffmpeg_cmd.extend([
-                "-b:v", video_bitrate,
-                "-maxrate", maxrate,
-                "-bufsize", bufsize,
-                "-pix_fmt", "yuv420p",
-                "-c:a", "aac",
-                "-b:a", f"{audio_bitrate}k",
-                "-movflags", "+faststart",
-                "-shortest",
-                final_output
-            ])
-            
-            # Log full ffmpeg command for debugging (properly quoted)
-            cmd_str = shlex.join(ffmpeg_cmd)
-            self._notify("log", ("info", f"FFmpeg command: {cmd_str}"))
-            
-            # Log encoder info
-            if video_codec == "h264_videotoolbox":
-                self._notify("log", ("info", "Using Apple VideoToolbox hardware encoder (Media Engine)"))
-                # Explain CPU usage if source is VP9
-                if fmt and fmt.vcodec and 'vp9' in fmt.vcodec.lower():
-                    self._notify("log", ("info", "Note: High CPU usage is from VP9 decoding (not hardware accelerated on macOS)"))
-            else:
-                self._notify("log", ("info", f"Using CPU encoder: {video_codec}"))
-            
-            # If GPU encoding fails, fall back to CPU
             # Progress: 60-85% if no SponsorBlock, 60-75% if SponsorBlock enabled
-            progress_end = 75 if self.settings_mgr.get('sponsorblock_enabled', False) else 85
-            success = self._run_ffmpeg_with_progress(ffmpeg_cmd, task, "⚙️ Converting", 60, progress_end, video_info.duration)
-            
-            if not success and video_codec == "h264_videotoolbox":
-                # Try CPU encoding as fallback
-                ffmpeg_cmd[ffmpeg_cmd.index("h264_videotoolbox")] = "libx264"
-                preset_idx = ffmpeg_cmd.index("libx264") + 1
-                ffmpeg_cmd.insert(preset_idx, "-preset")
-                ffmpeg_cmd.insert(preset_idx + 1, encoder_preset)
-                success = self._run_ffmpeg_with_progress(ffmpeg_cmd, task, "Converting (CPU)", 60, progress_end, video_info.duration)
-            
+            progress_end = 75 if cfg.get('sponsorblock_enabled', False) else 85
+            
+            # Source already H.264 + AAC (the usual YouTube case up to 1080p):
+            # remux into MP4 without re-encoding. Only in auto bitrate mode;
+            # per-resolution/custom bitrates are an explicit request to transcode.
+            success = False
+            keyframe_interval = None  # Set when the encode forces a keyframe grid
+            if bitrate_mode == "auto" and source_vcodec == "h264" and source_acodec == "aac":
+                remux_cmd = [
+                    FFMPEG_PATH,
+                    "-y",
+                    "-i", video_file,
+                    "-i", audio_file,
+                    "-map", "0:v:0",
+                    "-map", "1:a:0",
+                    "-c", "copy",
+                    "-movflags", "+faststart",
+                    "-shortest",
+                    final_output
+                ]
+                self._notify("log", ("info", "Source is already H.264 + AAC - remuxing without re-encoding"))
+                self._notify("log", ("info", f"FFmpeg command: {shlex.join(remux_cmd)}"))
+                success = self._run_ffmpeg_with_progress(remux_cmd, task, "⚙️ Remuxing", 60, progress_end, video_info.duration)
+                if not success:
+                    self._notify("log", ("warning", "Remux failed - falling back to re-encoding"))
+            
+            if not success:
+                # Build ffmpeg command - merge video and audio
+                ffmpeg_cmd = [FFMPEG_PATH, "-y"]
+                if video_codec == "h264_videotoolbox":
+                    # Decode on the Media Engine too; ffmpeg falls back to software
+                    # decoding for codecs VideoToolbox can't handle
+                    ffmpeg_cmd.extend(["-hwaccel", "videotoolbox"])
+                ffmpeg_cmd.extend([
+                    "-i", video_file,
+                    "-i", audio_file,
+                    "-map", "0:v:0",
+                    "-map", "1:a:0",
+                    "-c:v", video_codec,
+                ])
+                
+                # Add preset for CPU encoding
+                if video_codec == "libx264":
+                    ffmpeg_cmd.extend(["-preset", encoder_preset])
+                
+                # CRITICAL: Explicitly set output resolution to match source
+                # This prevents VideoToolbox from defaulting to lower resolution
+                if source_width and source_height:
+                    ffmpeg_cmd.extend(["-s", f"{source_width}x{source_height}"])
+                
+                # A keyframe every few seconds lets SponsorBlock cut this file
+                # without a second encode
+                if cfg.get('sponsorblock_enabled', False):
+                    keyframe_interval = SPONSORBLOCK_KEYFRAME_INTERVAL
+                    ffmpeg_cmd.extend(["-force_key_frames", f"expr:gte(t,n_forced*{keyframe_interval})"])
+                
+                # Add bitrate and encoding params
+                ffmpeg_cmd.extend([
+                    "-b:v", video_bitrate,
+                    "-maxrate", maxrate,
+                    "-bufsize", bufsize,
+                    "-pix_fmt", "yuv420p",
+                    "-c:a", "aac",
+                    "-b:a", f"{audio_bitrate}k",
+                    "-movflags", "+faststart",
+                    "-shortest",
+                    final_output
+                ])
+                
+                # Log full ffmpeg command for debugging (properly quoted)
+                cmd_str = shlex.join(ffmpeg_cmd)
+                self._notify("log", ("info", f"FFmpeg command: {cmd_str}"))
+                
+                # Log encoder info
+                if video_codec == "h264_videotoolbox":
+                    self._notify("log", ("info", "Using Apple VideoToolbox hardware encoder (Media Engine)"))
+                    # Explain CPU usage if source is VP9
+                    if fmt and fmt.vcodec and fmt.vcodec.lower().startswith(('vp9', 'vp09')):
+                        self._notify("log", ("info", "Note: High CPU usage is from VP9 decoding (not hardware accelerated on macOS)"))
+                else:
+                    self._notify("log", ("info", f"Using CPU encoder: {video_codec}"))
+                
+                # If GPU encoding fails, fall back to CPU
+                success = self._run_ffmpeg_with_progress(ffmpeg_cmd, task, "⚙️ Converting", 60, progress_end, video_info.duration)
+                
+                if not success and video_codec == "h264_videotoolbox":
+                    # Try CPU encoding (and decoding) as fallback
+                    hwaccel_idx = ffmpeg_cmd.index("-hwaccel")
+                    del ffmpeg_cmd[hwaccel_idx:hwaccel_idx + 2]
+                    ffmpeg_cmd[ffmpeg_cmd.index("h264_videotoolbox")] = "libx264"
+                    preset_idx = ffmpeg_cmd.index("libx264") + 1
+                    ffmpeg_cmd.insert(preset_idx, "-preset")
+                    ffmpeg_cmd.insert(preset_idx + 1, encoder_preset)
+                    success = self._run_ffmpeg_with_progress(ffmpeg_cmd, task, "Converting (CPU)", 60, progress_end, video_info.duration)
+                
             # Cleanup ALL temp files with this video_id
             try:
                 files_removed = []
-                for fname in os.listdir(self.output_dir):
-                    # Remove any file containing the video_id that's not the final output
-                    if video_id in fname and fname != os.path.basename(final_output):
-                        file_path = os.path.join(self.output_dir, fname)
-                        try:
-                            os.remove(file_path)
-                            files_removed.append(fname)
-                        except:
-                            pass
+                final_name = os.path.basename(final_output)
+                with os.scandir(self.output_dir) as entries:
+                    for entry in entries:
+                        fname = entry.name
+                        # Remove any file containing the video_id that's not the final output
+                        if video_id in fname and fname != final_name:
+                            try:
+                                os.remove(entry.path)
+                                files_removed.append(fname)
+                            except:
+                                pass
                 
                 if files_removed:
                     self._notify("log", ("info", f"Cleaned up temp files: {', '.join(files_removed)}"))
@@ -3820,9 +4594,10 @@ class DownloadManager:
             
             if success and os.path.exists(final_output):
                 # Step 4: Apply SponsorBlock post-processing if enabled
-                if self.settings_mgr.get('sponsorblock_enabled', False):
+                if cfg.get('sponsorblock_enabled', False):
                     final_output = self._apply_sponsorblock_postprocess(
-                        task, final_output, video_info.id, video_info.duration
+                        task, final_output, video_info.id, video_info.duration, cfg,
+                        keyframe_interval=keyframe_interval
                     )
                 else:
                     # No SponsorBlock - mark as 100% complete after conversion
@@ -3853,8 +4628,7 @@ class DownloadManager:
                         "duration": video_info.duration,
                         "format": f"{fmt.height}p" if fmt and fmt.height else "best"
                     }
-                    hist_mgr = HistoryManager(HISTORY_PATH)
-                    hist_mgr.add(history_entry)
+                    self.history_mgr.add(history_entry)
                 except Exception:
                     pass  # Don't fail download if history fails
                 
@@ -3868,10 +4642,21 @@ class DownloadManager:
             task.error_message = str(e)
         
         finally:
+            # Stop an audio download still running after an early return
+            if audio_future is not None and not audio_future.done():
+                audio_abort.set()
+                if self.background_process:
+                    self._signal_process_group(self.background_process, signal.SIGTERM)
+                try:
+                    audio_future.result(timeout=10)
+                except Exception:
+                    pass
             self.current_process = None
-            self._notify("task_updated", task)
+            self.background_process = None
+            self._notify("task_updated", task, force=True)
     
-    def _cleanup_partial_files(self, directory: str, video_id: str):
+    def _cleanup_partial_files(self, directory: str, video_id: str,
+                               stream: Optional[str] = None):
         """Clean up partial/incomplete download files before retry.
         
         This prevents 'format not available' errors caused by yt-dlp trying
@@ -3881,21 +4666,26 @@ class DownloadManager:
         Args:
             directory: Directory containing the files
             video_id: Video ID to match files against
+            stream: Only remove this stream's files ("temp_video" or
+                "temp_audio"), e.g. while the other one is still downloading
         """
         try:
-            import glob
-            patterns = [
-                os.path.join(directory, f"{video_id}*.part"),
-                os.path.join(directory, f"{video_id}_temp_video.*"),
-                os.path.join(directory, f"{video_id}_temp_audio.*"),
-            ]
-            for pattern in patterns:
-                for filepath in glob.glob(pattern):
-                    try:
-                        os.remove(filepath)
-                        self._notify("log", ("info", f"Cleaned up: {os.path.basename(filepath)}"))
-                    except Exception as e:
-                        pass  # Ignore cleanup errors
+            # One directory pass for {id}*.part, {id}_temp_video.* and {id}_temp_audio.*
+            if stream:
+                temp_prefixes = (f"{video_id}_{stream}.",)
+            else:
+                temp_prefixes = (f"{video_id}_temp_video.", f"{video_id}_temp_audio.")
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    fname = entry.name
+                    if not fname.startswith(video_id):
+                        continue
+                    if fname.startswith(temp_prefixes) or (not stream and fname.endswith('.part')):
+                        try:
+                            os.remove(entry.path)
+                            self._notify("log", ("info", f"Cleaned up: {fname}"))
+                        except Exception as e:
+                            pass  # Ignore cleanup errors
         except Exception:
             pass  # Don't fail the download if cleanup fails
     
@@ -3915,27 +4705,30 @@ class DownloadManager:
             # Extract video_id from prefix (e.g., "dT9CTuPyyrU" from "dT9CTuPyyrU_temp_video")
             video_id = prefix.split('_temp_')[0] if '_temp_' in prefix else prefix
             
-            for fname in os.listdir(directory):
-                # Skip .part files (incomplete downloads)
-                if fname.endswith('.part'):
-                    continue
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    fname = entry.name
+                    # Every candidate starts with the video_id (the prefix does too);
+                    # skip everything else and .part files (incomplete downloads)
+                    if not fname.startswith(video_id) or fname.endswith('.part'):
+                        continue
                     
-                # Match files that start with the full prefix
-                if fname.startswith(prefix):
-                    matches.append(fname)
-                # Also match files that start with just the video_id (yt-dlp sometimes names differently)
-                elif fname.startswith(video_id) and '_temp_' not in fname:
-                    # Only add if looking for video and it's a video extension
-                    # or looking for audio and it's an audio extension
-                    if is_audio:
-                        if any(fname.endswith(ext) for ext in ['.m4a', '.mp4', '.aac', '.webm', '.opus', '.mp3', '.ogg']):
-                            matches.append(fname)
-                    else:
-                        if any(fname.endswith(ext) for ext in ['.mp4', '.webm', '.mkv']):
-                            # Exclude audio-only format files for video search
-                            audio_formats = ['.f251.', '.f140.', '.f139.', '.f250.', '.f249.']
-                            if not any(af in fname for af in audio_formats):
+                    # Match files that start with the full prefix
+                    if fname.startswith(prefix):
+                        matches.append(fname)
+                    # Also match files that start with just the video_id (yt-dlp sometimes names differently)
+                    elif '_temp_' not in fname:
+                        # Only add if looking for video and it's a video extension
+                        # or looking for audio and it's an audio extension
+                        if is_audio:
+                            if fname.endswith(('.m4a', '.mp4', '.aac', '.webm', '.opus', '.mp3', '.ogg')):
                                 matches.append(fname)
+                        else:
+                            if fname.endswith(('.mp4', '.webm', '.mkv')):
+                                # Exclude audio-only format files for video search
+                                audio_formats = ['.f251.', '.f140.', '.f139.', '.f250.', '.f249.']
+                                if not any(af in fname for af in audio_formats):
+                                    matches.append(fname)
             
             if not matches:
                 return None
@@ -3970,8 +4763,50 @@ class DownloadManager:
             self._notify("log", ("error", f"Error finding temp file: {e}"))
         return None
     
+    def _find_file_by_video_id(self, video_id: str, extensions: Tuple[str, ...],
+                               exclude: str, min_size: int = 0) -> Optional[str]:
+        """Broad fallback search: any file in the output directory whose name
+        contains video_id and ends with one of extensions.
+        
+        Args:
+            video_id: Video ID to look for anywhere in the filename
+            extensions: Accepted filename endings
+            exclude: Skip files whose name contains this (e.g. "_temp_audio")
+            min_size: Only accept files larger than this many bytes
+        
+        Returns:
+            Full path to the first matching file, or None if not found
+        """
+        candidates = []
+        named = []
+        try:
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    fname = entry.name
+                    if video_id not in fname:
+                        continue
+                    named.append(fname)
+                    if exclude not in fname and fname.endswith(extensions):
+                        candidates.append(entry)
+        except OSError as e:
+            self._notify("log", ("error", f"Error listing directory: {e}"))
+            return None
+        
+        self._notify("log", ("info", f"Files with video_id in name: {named}"))
+        for entry in candidates:
+            try:
+                fsize = entry.stat().st_size
+            except OSError:
+                continue
+            if fsize > min_size:
+                self._notify("log", ("info", f"Found file: {entry.name} ({fsize} bytes)"))
+                return entry.path
+        return None
+    
     def _apply_sponsorblock_postprocess(self, task: DownloadTask, video_path: str, 
-                                       video_id: str, duration: Optional[int]) -> str:
+                                       video_id: str, duration: Optional[int],
+                                       cfg: Dict[str, Any],
+                                       keyframe_interval: Optional[float] = None) -> str:
         """
         Apply SponsorBlock segment removal via post-processing.
         
@@ -3980,13 +4815,17 @@ class DownloadManager:
             video_path: Path to the converted video file
             video_id: YouTube video ID
             duration: Video duration in seconds
+            cfg: The task's settings snapshot (categories and action)
+            keyframe_interval: Spacing of the keyframes the conversion forced,
+                if any. Cuts are then moved back onto a keyframe and the kept
+                ranges are stream-copied; otherwise the video is re-encoded.
         
         Returns:
             Path to final video (same as input if no segments removed, new path if re-encoded)
         """
         try:
             # Get enabled categories
-            categories = self.settings_mgr.get('sponsorblock_categories', ['sponsor'])
+            categories = cfg.get('sponsorblock_categories', ['sponsor'])
             if not categories:
                 self._notify("log", ("info", "SponsorBlock enabled but no categories selected"))
                 return video_path
@@ -4003,19 +4842,31 @@ class DownloadManager:
                 self._notify("task_updated", task)
                 return video_path
             
-            # Count and log segments
+            # One pass over the segments sorted by start: total removed time
+            # and the ranges to KEEP between them (the tail is added below,
+            # once the duration is known)
             segment_count = len(segments)
-            total_duration = sum(seg['segment'][1] - seg['segment'][0] for seg in segments)
+            sorted_segments = sorted(segments, key=lambda x: x['segment'][0])
+            total_duration = 0.0
+            keep_segments = []
+            last_end = 0.0
+            for seg in sorted_segments:
+                start, end = seg['segment']
+                total_duration += end - start
+                # Add the part before this segment
+                if start > last_end:
+                    keep_segments.append((last_end, start))
+                last_end = max(last_end, end)
             self._notify("log", ("success", f"Found {segment_count} segments to remove ({total_duration:.1f}s total)"))
             
-            # Log each segment
-            for i, seg in enumerate(segments, 1):
-                start, end = seg['segment']
-                category = seg.get('category', 'unknown')
-                self._notify("log", ("info", f"  Segment {i}: {start:.1f}s - {end:.1f}s ({category})"))
+            # All segments on one log line
+            self._notify("log", ("info", "  Segments: " + "; ".join(
+                f"{seg['segment'][0]:.1f}s - {seg['segment'][1]:.1f}s ({seg.get('category', 'unknown')})"
+                for seg in sorted_segments
+            )))
             
             # Check if we should mark or remove
-            action = self.settings_mgr.get('sponsorblock_action', 'remove')
+            action = cfg.get('sponsorblock_action', 'remove')
             if action == 'mark':
                 self._notify("log", ("warning", "SponsorBlock 'mark' mode not yet supported in post-processing"))
                 return video_path
@@ -4030,24 +4881,12 @@ class DownloadManager:
             
             # Update task status
             task.status = DownloadStatus.CONVERTING
-            self._notify("task_updated", task)
-            self._notify("log", ("info", "Re-encoding video with SponsorBlock segments removed..."))
-            
-            # Create output path for re-encoded file
-            base_path = os.path.splitext(video_path)[0]
-            temp_output = f"{base_path}_sb_temp.mp4"
-            
-            # Build list of segments to KEEP (inverse of segments to remove)
-            keep_segments = []
-            sorted_segments = sorted(segments, key=lambda x: x['segment'][0])
-            last_end = 0.0
-            
-            for seg in sorted_segments:
-                start, end = seg['segment']
-                # Add the part before this segment
-                if start > last_end:
-                    keep_segments.append((last_end, start))
-                last_end = max(last_end, end)
+            self._notify("task_updated", task)
+            self._notify("log", ("info", "Re-encoding video with SponsorBlock segments removed..."))
+            
+            # Create output path for re-encoded file
+            base_path = os.path.splitext(video_path)[0]
+            temp_output = f"{base_path}_sb_temp.mp4"
             
             # Add final segment after last removed part
             if last_end < float(duration):
@@ -4057,104 +4896,54 @@ class DownloadManager:
                 self._notify("log", ("warning", "No segments to keep after removal"))
                 return video_path
             
-            # Use ffmpeg's segment splitting and concat approach
-            # This is more reliable than complex filter expressions
-            import tempfile
-            segment_files = []
-            concat_file = None
-            
-            try:
-                # Create a temporary directory for segments
-                temp_dir = tempfile.mkdtemp()
-                concat_list_path = os.path.join(temp_dir, 'concat_list.txt')
-                
-                # Extract each segment to keep
-                total_segments = len(keep_segments)
-                for i, (start, end) in enumerate(keep_segments):
-                    segment_path = os.path.join(temp_dir, f'segment_{i:03d}.mp4')
-                    segment_files.append(segment_path)
-                    
-                    # Update progress: 75-85% for extraction phase
-                    extraction_progress = 75 + (10 * i / total_segments)
-                    task.progress = extraction_progress
-                    self._notify("task_updated", task)
-                    self._notify("log", ("info", f"Extracting segment {i+1}/{total_segments} ({start:.1f}s - {end:.1f}s)"))
-                    
-                    # Extract segment with ffmpeg
-                    extract_cmd = [
-                        FFMPEG_PATH,
-                        "-y",
-                        "-i", video_path,
-                        "-ss", str(start),
-                        "-to", str(end),
-                        "-c", "copy",  # Copy without re-encoding (fast)
-                        "-avoid_negative_ts", "1",
-                        segment_path
-                    ]
-                    
-                    result = subprocess.run(
-                        extract_cmd,
-                        capture_output=True,
-                        text=True,
-                        encoding='utf-8',
-                        errors='replace'
-                    )
-                    
-                    if result.returncode != 0:
-                        self._notify("log", ("error", f"Failed to extract segment {i}: {result.stderr[:200]}"))
-                        raise Exception(f"Segment extraction failed")
-                
-                # Create concat list file
-                with open(concat_list_path, 'w') as f:
-                    for seg_file in segment_files:
-                        f.write(f"file '{seg_file}'\n")
-                
-                # Update progress before concat
-                task.progress = 85
-                self._notify("task_updated", task)
-                self._notify("log", ("info", f"Merging {len(segment_files)} segments and re-encoding..."))
-                
-                # Concatenate all segments
-                concat_cmd = [
-                    FFMPEG_PATH,
-                    "-y",
-                    "-f", "concat",
-                    "-safe", "0",
-                    "-i", concat_list_path,
-                    "-c:v", "libx264",
-                    "-preset", "fast",
-                    "-crf", "18",
-                    "-c:a", "aac",
-                    "-b:a", "192k",
-                    "-movflags", "+faststart",
-                    temp_output
-                ]
-                
-                # Log command
-                cmd_str = shlex.join(concat_cmd)
-                self._notify("log", ("info", f"SponsorBlock FFmpeg command: {cmd_str}"))
-                
-                # Run ffmpeg with progress tracking (85-100%)
-                success = self._run_ffmpeg_with_progress(
-                    concat_cmd, task, "Merging segments", 85, 100, duration
+            if keyframe_interval:
+                return self._remove_segments_by_copy(
+                    task, video_path, temp_output, keep_segments, keyframe_interval,
+                    segment_count, float(duration)
                 )
-                
-                # Cleanup temp files
-                import shutil
-                shutil.rmtree(temp_dir, ignore_errors=True)
-                
-            except Exception as e:
-                # Cleanup on error
-                import shutil
-                if 'temp_dir' in locals():
-                    shutil.rmtree(temp_dir, ignore_errors=True)
-                raise e
+            
+            # Cut and join in one ffmpeg pass: each kept range is its own seeked
+            # input (-ss/-t before -i is frame-accurate when re-encoding) and
+            # the concat filter joins them, so no segment files are written
+            concat_cmd = [FFMPEG_PATH, "-y"]
+            filter_inputs = []
+            for i, (start, end) in enumerate(keep_segments):
+                concat_cmd += ["-ss", f"{start:.3f}", "-t", f"{end - start:.3f}", "-i", video_path]
+                filter_inputs.append(f"[{i}:v:0][{i}:a:0]")
+            filter_graph = f"{''.join(filter_inputs)}concat=n={len(keep_segments)}:v=1:a=1[v][a]"
+            concat_cmd += [
+                "-filter_complex", filter_graph,
+                "-map", "[v]",
+                "-map", "[a]",
+                "-c:v", "libx264",
+                "-preset", "fast",
+                "-crf", "18",
+                "-c:a", "aac",
+                "-b:a", "192k",
+                "-movflags", "+faststart",
+                temp_output
+            ]
+            
+            task.progress = 75
+            self._notify("task_updated", task)
+            self._notify("log", ("info", f"Joining {len(keep_segments)} segments and re-encoding..."))
+            
+            # Log command
+            cmd_str = shlex.join(concat_cmd)
+            self._notify("log", ("info", f"SponsorBlock FFmpeg command: {cmd_str}"))
+            
+            # Run ffmpeg with progress tracking (75-100%); ffmpeg reports output
+            # time, so progress is measured against the kept duration
+            kept_duration = sum(end - start for start, end in keep_segments)
+            success = self._run_ffmpeg_with_progress(
+                concat_cmd, task, "Merging segments", 75, 100, kept_duration
+            )
             
             if success and os.path.exists(temp_output):
                 # Replace original file with re-encoded version
                 try:
-                    os.remove(video_path)
-                    os.rename(temp_output, video_path)
+                    # Atomic swap: video_path never goes missing (temp is in the same dir)
+                    os.replace(temp_output, video_path)
                     self._notify("log", ("success", f"SponsorBlock removed {segment_count} segments successfully"))
                 except Exception as e:
                     self._notify("log", ("error", f"Failed to replace file: {e}"))
@@ -4171,10 +4960,127 @@ class DownloadManager:
             self._notify("log", ("error", f"SponsorBlock post-processing error: {e}"))
             return video_path
     
+    def _remove_segments_by_copy(self, task: DownloadTask, video_path: str, temp_output: str,
+                                 keep_segments: List[Tuple[float, float]],
+                                 keyframe_interval: float, segment_count: int,
+                                 duration: float) -> str:
+        """Join the kept ranges of a keyframe-aligned file with stream copy.
+        
+        The conversion forced a keyframe at the first frame at or after every
+        multiple of keyframe_interval, so each kept range is moved back to the
+        keyframe before it. The segment muxer splits the file on those
+        keyframes and the concat demuxer joins the kept parts, trimming each
+        at its end (outpoint), without decoding.
+        """
+        # Snap starts back onto the keyframe grid; a removed segment shorter
+        # than the gap can vanish, so overlapping ranges are merged
+        aligned: List[Tuple[float, float]] = []
+        for start, end in keep_segments:
+            start = math.floor(start / keyframe_interval) * keyframe_interval
+            if aligned and start <= aligned[-1][1]:
+                aligned[-1] = (aligned[-1][0], max(aligned[-1][1], end))
+            else:
+                aligned.append((start, end))
+        
+        # The forced keyframe sits up to one frame after the grid time, and an
+        # inpoint would have to hit it exactly: the demuxer starts from the
+        # keyframe at or before the inpoint and passes the packets before it
+        # through. The segment muxer instead cuts at the first keyframe at or
+        # after each split time, i.e. on the forced one, and restarts each
+        # part's timestamps at zero, so the parts need no inpoint at all.
+        base_path = os.path.splitext(video_path)[0]
+        part_pattern = f"{base_path}_sb_part%03d.mp4"
+        split_times = [start for start, _ in aligned if start > 0]
+        part_files = [part_pattern % i for i in range(len(split_times) + 1)] if split_times else []
+        # With a removed segment at the very start, part 0 holds only that
+        parts = (part_files if aligned[0][0] == 0 else part_files[1:]) or [video_path]
+        
+        # Each part starts at its range's keyframe; the outpoint is relative
+        # to that, landing up to a frame later than the segment start
+        entries = []
+        for part, (start, end) in zip(parts, aligned):
+            quoted_path = part.replace("'", "'\\''")
+            entries.append(f"file '{quoted_path}'\noutpoint {end - start:.3f}\n")
+        concat_list_path = f"{base_path}_sb_concat.txt"
+        
+        success = True
+        try:
+            if split_times:
+                split_cmd = [
+                    FFMPEG_PATH, "-y",
+                    "-i", video_path,
+                    "-map", "0",
+                    "-c", "copy",
+                    "-f", "segment",
+                    "-segment_times", ",".join(f"{t:.3f}" for t in split_times),
+                    "-reset_timestamps", "1",
+                    part_pattern
+                ]
+                
+                task.progress = 75
+                self._notify("task_updated", task)
+                self._notify("log", ("info", f"Splitting video on keyframes at {len(split_times)} points..."))
+                self._notify("log", ("info", f"SponsorBlock FFmpeg command: {shlex.join(split_cmd)}"))
+                
+                success = self._run_ffmpeg_with_progress(
+                    split_cmd, task, "Splitting segments", 75, 85, duration
+                )
+            
+            with open(concat_list_path, 'w', encoding='utf-8') as f:
+                f.write(''.join(entries))
+            
+            concat_cmd = [
+                FFMPEG_PATH, "-y",
+                "-f", "concat",
+                "-safe", "0",
+                "-i", concat_list_path,
+                "-map", "0",
+                "-c", "copy",
+                "-avoid_negative_ts", "make_zero",
+                "-movflags", "+faststart",
+                temp_output
+            ]
+            
+            if success:
+                task.progress = 85
+                self._notify("task_updated", task)
+                self._notify("log", ("info", f"Joining {len(aligned)} segments on keyframes (no re-encode)..."))
+                self._notify("log", ("info", f"SponsorBlock FFmpeg command: {shlex.join(concat_cmd)}"))
+                
+                kept_duration = sum(end - start for start, end in aligned)
+                success = self._run_ffmpeg_with_progress(
+                    concat_cmd, task, "Merging segments", 85, 100, kept_duration
+                )
+        finally:
+            for path in [concat_list_path] + part_files:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        
+        if success and os.path.exists(temp_output):
+            # Replace original file with the cut version
+            try:
+                # Atomic swap: video_path never goes missing (temp is in the same dir)
+                os.replace(temp_output, video_path)
+                self._notify("log", ("success", f"SponsorBlock removed {segment_count} segments successfully"))
+            except Exception as e:
+                self._notify("log", ("error", f"Failed to replace file: {e}"))
+                if os.path.exists(temp_output):
+                    os.remove(temp_output)
+        else:
+            self._notify("log", ("error", "SponsorBlock segment removal failed"))
+            if os.path.exists(temp_output):
+                os.remove(temp_output)
+        
+        return video_path
+    
     
     def _run_subprocess_with_progress(self, cmd: List[str], task: DownloadTask, 
                                        stage: str, progress_start: float, progress_end: float,
-                                       expected_file_pattern: Optional[str] = None):
+                                       expected_file_pattern: Optional[str] = None,
+                                       shared_progress: Optional[Dict[str, float]] = None,
+                                       background: bool = False) -> Optional[str]:
         """Run a subprocess and update progress with speed metrics.
         
         v17.7.5: Enhanced to detect yt-dlp merging phases and show file activity
@@ -4182,180 +5088,217 @@ class DownloadManager:
         
         Args:
             expected_file_pattern: Optional pattern to check if file was downloaded despite errors
+            shared_progress: For runs going side by side: each stores its scaled
+                share under its stage name and task.progress is the sum, so the
+                ranges of runs sharing one dict should tile from 0
+            background: Run next to the foreground download; the process is kept
+                in background_process and only progress and log lines are
+                reported (ETA, speed and status detail belong to the foreground)
+        
+        Returns:
+            None on success, otherwise the error message for the task
         """
         try:
             # Start progress tracking for this stage
-            stage_name = "downloading_video" if "video" in stage.lower() else "downloading_audio"
-            self.progress_tracker.start(stage_name)
+            if not background:
+                stage_name = "downloading_video" if "video" in stage.lower() else "downloading_audio"
+                self.progress_tracker.start(stage_name)
             
-            self.current_process = subprocess.Popen(
+            # Binary pipe, read in chunks by iter_pipe_batches(); lines are
+            # matched as bytes and only decoded when reported
+            process = subprocess.Popen(
                 cmd, 
                 stdout=subprocess.PIPE, 
-                stderr=subprocess.STDOUT, 
-                text=True,
-                encoding='utf-8',
-                errors='replace'
+                stderr=subprocess.STDOUT,
+                bufsize=PIPE_BUFFER_SIZE,
+                start_new_session=True  # Own process group, so a stop reaches ffmpeg children
             )
+            if background:
+                self.background_process = process
+            else:
+                self.current_process = process
             
-            progress_re = re.compile(r'\[download\]\s+(\d+(?:\.\d+)?)%')
-            speed_re = re.compile(r'at\s+([\d.]+)(Ki|Mi|Gi)?B/s')
-            # v17.7.5: Detect merging/processing messages from yt-dlp
-            merge_re = re.compile(r'\[Merger\]|\[ffmpeg\]|\[ExtractAudio\]|\[FixupM3u8\]|\[Fixup\]|Merging formats|Destination:.*_temp')
-            chapter_re = re.compile(r'Chapter \d+|Writing chapter')
-            error_lines = []  # Capture error messages
+            # Capture error messages; only the first is reported, so a noisy
+            # run keeps the first few instead of growing without bound
+            error_lines: List[str] = []
             
             # v17.7.5: Track when we last saw real progress
-            last_progress_update = time.time()
+            last_progress_update = time.monotonic_ns()
             is_in_merge_phase = False
             merge_start_time = None
             
-            # v17.7.5: Start a background thread to monitor file growth during stalls
+            # v17.7.5: Monitor file growth during stalls. The check runs once a
+            # second on the shared poll thread (see ProgressPollService.watch)
+            poll_service = get_progress_poll_service()
             file_monitor_active = False
+            # The output directory is scanned only until a matching file
+            # turns up, or again if it disappears (e.g. renamed by a fixup);
+            # every other tick is a single stat() of that path
+            monitored_path = None
+            format_file_size = self.progress_tracker.format_file_size
+            
+            def monitor_file_growth(now: int) -> bool:
+                """Poll tick: update the UI during long operations."""
+                nonlocal monitored_path
+                if process.poll() is not None:
+                    return False
+                # Check for growing files in output directory
+                if monitored_path is None and expected_file_pattern:
+                    with os.scandir(self.output_dir) as entries:
+                        for entry in entries:
+                            if expected_file_pattern in entry.name and entry.is_file():
+                                monitored_path = entry.path
+                                break
+                if monitored_path is None:
+                    return True
+                try:
+                    size = os.stat(monitored_path).st_size
+                except OSError:
+                    monitored_path = None  # Gone; look for it again next tick
+                    return True
+                
+                if size > 0:
+                    task.current_file_size = size
+                    size_str = format_file_size(size)
+                    if is_in_merge_phase and merge_start_time:
+                        elapsed = (now - merge_start_time) * 1e-9
+                        task.status_detail = f"Merging streams... ({size_str}, {elapsed:.0f}s elapsed)"
+                    else:
+                        task.status_detail = f"Processing... ({size_str})"
+                    self._notify("task_updated", task)
+                return True
             
-            def monitor_file_growth():
-                """Background thread to update UI during long operations."""
-                nonlocal file_monitor_active
-                while file_monitor_active and self.current_process and self.current_process.poll() is None:
-                    # Check for growing files in output directory
-                    try:
-                        for fname in os.listdir(self.output_dir):
-                            if expected_file_pattern and expected_file_pattern in fname:
-                                fpath = os.path.join(self.output_dir, fname)
-                                if os.path.isfile(fpath):
-                                    is_growing, size, rate = False, 0, 0
-                                    try:
-                                        size = os.path.getsize(fpath)
-                                        if hasattr(self, '_last_monitored_size'):
-                                            is_growing = size > self._last_monitored_size
-                                            if is_growing:
-                                                rate = (size - self._last_monitored_size) * 8 / 1_000_000  # Mbps
-                                        self._last_monitored_size = size
-                                    except:
-                                        pass
-                                    
-                                    if size > 0:
-                                        task.current_file_size = size
-                                        size_str = self.progress_tracker.format_file_size(size)
-                                        if is_in_merge_phase and merge_start_time:
-                                            elapsed = time.time() - merge_start_time
-                                            task.status_detail = f"Merging streams... ({size_str}, {elapsed:.0f}s elapsed)"
-                                        else:
-                                            task.status_detail = f"Processing... ({size_str})"
-                                        self._notify("task_updated", task)
-                                    break
-                    except Exception:
-                        pass
-                    time.sleep(1)  # Check every second
+            # Percent -> share of this stage's progress range
+            pct_scale = (progress_end - progress_start) * 0.01
             
-            for line in self.current_process.stdout:
-                if self._paused:
-                    while self._paused and self._running:
-                        time.sleep(0.1)
+            def publish_progress(match) -> None:
+                """Apply a download progress line to the task and notify."""
+                nonlocal last_progress_update, is_in_merge_phase
+                # Parse progress percentage
+                pct = float(match.group("pct"))
+                # Scale to our progress range
+                share = pct * pct_scale
+                if shared_progress is None:
+                    task.progress = progress_start + share
+                else:
+                    shared_progress[stage] = share
+                    task.progress = sum(shared_progress.values())
+                if background:
+                    self._notify("task_updated", task)
+                    return
+                last_progress_update = time.monotonic_ns()
+                is_in_merge_phase = False  # Real progress means we're past merge phase
+                task.status_detail = None  # Clear special status
                 
-                # Capture error and warning lines for debugging
-                line_lower = line.lower()
-                if "error" in line_lower:
-                    error_lines.append(line.strip())
-                    # Don't log errors immediately - we have retry logic
-                    # Errors will be shown if all retries fail
-                elif "warning" in line_lower:
-                    # Filter out confusing warnings that don't help users
-                    skip_warnings = [
-                        "install ffmpeg",  # We have ffmpeg bundled
-                        "dash m4a",        # Related to above
-                        "skipped",         # Format skipped warnings
-                        "merger",          # Merger warnings handled elsewhere
-                        "429",             # Rate limiting - handled by retry
-                        "403",             # Forbidden - handled by retry
-                    ]
-                    if not any(skip in line_lower for skip in skip_warnings):
-                        self._notify("log", ("warning", f"yt-dlp: {line.strip()[:150]}"))
+                # Update progress tracker (reuse the timestamp read above)
+                snapshot = self.progress_tracker.tick(task.progress, now=last_progress_update)
                 
-                # v17.7.5: Detect merge/processing phases
-                if merge_re.search(line):
-                    if not is_in_merge_phase:
-                        is_in_merge_phase = True
-                        merge_start_time = time.time()
-                        task.status_detail = "Merging video and audio streams..."
-                        self._notify("log", ("info", "Merging streams (this may take several minutes for long videos)..."))
-                        self._notify("task_updated", task)
-                        
-                        # Start file monitoring thread
-                        if not file_monitor_active:
-                            file_monitor_active = True
-                            self._last_monitored_size = 0
-                            monitor_thread = threading.Thread(target=monitor_file_growth, daemon=True)
-                            monitor_thread.start()
+                # Parse download speed (captured by the same match)
+                speed_text = match.group("speed")
+                if speed_text:
+                    # Convert to Mbps (no unit prefix means plain bytes)
+                    mbps = float(speed_text) * _SPEED_MBPS[match.group("unit") or b""]
+                    task.download_speed_mbps = mbps
                 
-                # v17.7.5: Detect chapter processing
-                if chapter_re.search(line):
-                    task.status_detail = f"Processing chapters..."
-                    self._notify("task_updated", task)
+                # Get ETA from progress tracker
+                task.eta = snapshot.eta_text
                 
-                # Parse progress percentage
-                match = progress_re.search(line)
-                if match:
-                    pct = float(match.group(1))
-                    # Scale to our progress range
-                    task.progress = progress_start + (pct / 100) * (progress_end - progress_start)
-                    last_progress_update = time.time()
-                    is_in_merge_phase = False  # Real progress means we're past merge phase
-                    task.status_detail = None  # Clear special status
-                    
-                    # Update progress tracker
-                    self.progress_tracker.update(task.progress)
+                self._notify("task_updated", task)
+            
+            search_line = _YTDLP_LINE_RE.search
+            
+            # Each batch is everything yt-dlp wrote since the previous read.
+            # Progress lines in a batch supersede each other, so only the
+            # newest is applied (before any merge/chapter line, to keep order)
+            for lines in iter_pipe_batches(process.stdout):
+                self._pause_event.wait()
+                
+                pending_progress = None
+                for raw_line in lines:
+                    # Capture error and warning lines for debugging. Lines are
+                    # matched as raw bytes; only these are decoded (errors=
+                    # 'replace' handles unicode in titles)
+                    if _ERROR_OR_WARNING_RE.search(raw_line):
+                        line = raw_line.decode('utf-8', 'replace')
+                        line_lower = line.lower()
+                        if "error" in line_lower:
+                            if len(error_lines) < 16:
+                                error_lines.append(line.strip())
+                            # Don't log errors immediately - we have retry logic
+                            # Errors will be shown if all retries fail
+                        elif "warning" in line_lower:
+                            # Filter out confusing warnings that don't help users
+                            if not any(skip in line_lower for skip in _YTDLP_SKIP_WARNINGS):
+                                self._notify("log", ("warning", f"yt-dlp: {line.strip()[:150]}"))
                     
-                    # Parse download speed
-                    speed_match = speed_re.search(line)
-                    if speed_match:
-                        speed_value = float(speed_match.group(1))
-                        speed_unit = speed_match.group(2) or ""
-                        
-                        # Convert to Mbps
-                        if speed_unit == "Ki":
-                            mbps = (speed_value * 1024 * 8) / 1_000_000
-                        elif speed_unit == "Mi":
-                            mbps = (speed_value * 1024 * 1024 * 8) / 1_000_000
-                        elif speed_unit == "Gi":
-                            mbps = (speed_value * 1024 * 1024 * 1024 * 8) / 1_000_000
-                        else:
-                            mbps = (speed_value * 8) / 1_000_000  # Assume bytes
-                        
-                        self.progress_tracker.set_download_speed(mbps)
-                        task.download_speed = self.progress_tracker.format_speed()
+                    match = search_line(raw_line)
+                    if match is None:
+                        continue
+                    kind = match.lastgroup
+                    if kind == "progress":
+                        pending_progress = match
+                        continue
+                    if pending_progress is not None:
+                        publish_progress(pending_progress)
+                        pending_progress = None
                     
-                    # Get ETA from progress tracker
-                    task.eta = self.progress_tracker.format_eta()
+                    # v17.7.5: Detect merge/processing phases
+                    if kind == "merge":
+                        if not background and not is_in_merge_phase:
+                            is_in_merge_phase = True
+                            merge_start_time = time.monotonic_ns()
+                            task.status_detail = "Merging video and audio streams..."
+                            self._notify("log", ("info", "Merging streams (this may take several minutes for long videos)..."))
+                            self._notify("task_updated", task)
+                            
+                            # Start file monitoring
+                            if not file_monitor_active:
+                                file_monitor_active = True
+                                poll_service.watch(monitor_file_growth)
                     
-                    self._notify("task_updated", task)
+                    # v17.7.5: Detect chapter processing
+                    elif kind == "chapter" and not background:
+                        task.status_detail = f"Processing chapters..."
+                        self._notify("task_updated", task)
+                
+                if pending_progress is not None:
+                    publish_progress(pending_progress)
             
             # Stop file monitor
-            file_monitor_active = False
+            if file_monitor_active:
+                poll_service.unwatch(monitor_file_growth)
+                file_monitor_active = False
             
-            self.current_process.wait()
+            process.wait()
             
             # Clear status detail after completion
-            task.status_detail = None
+            if not background:
+                task.status_detail = None
             
             # Check if download succeeded despite non-zero return code
             file_exists = False
             found_file = None
-            if expected_file_pattern and self.current_process.returncode != 0:
+            if expected_file_pattern and process.returncode != 0:
                 # Wait a moment for file system to sync and .part to be renamed
                 time.sleep(1)
                 
                 # Check if a COMPLETE file (not .part) matching the pattern exists
                 try:
-                    for fname in os.listdir(self.output_dir):
-                        if expected_file_pattern in fname:
+                    # The pattern is the video ID, which can sit anywhere in the
+                    # name, so this stays a substring test; scandir just avoids
+                    # building the full listing and re-joining paths
+                    with os.scandir(self.output_dir) as it:
+                        for entry in it:
+                            fname = entry.name
+                            if expected_file_pattern not in fname:
+                                continue
                             # CRITICAL: Skip .part files - these are incomplete!
                             if fname.endswith('.part'):
                                 # Don't log this as warning - it's expected during retries
                                 continue
                             # Check if file has actual content
-                            fpath = os.path.join(self.output_dir, fname)
                             try:
-                                fsize = os.path.getsize(fpath)
+                                fsize = entry.stat().st_size
                                 if fsize > 10000:  # At least 10KB
                                     file_exists = True
                                     found_file = fname
@@ -4367,17 +5310,15 @@ class DownloadManager:
                     self._notify("log", ("error", f"Error checking files: {e}"))
             
             # Only fail if returncode is non-zero AND no complete file was downloaded
-            if self.current_process.returncode != 0 and not file_exists:
-                task.status = DownloadStatus.FAILED
+            if process.returncode != 0 and not file_exists:
                 # Include captured errors in error message
                 if error_lines:
-                    task.error_message = f"{stage} failed: {error_lines[0]}"
-                else:
-                    task.error_message = f"{stage} failed (exit code {self.current_process.returncode})"
+                    return f"{stage} failed: {error_lines[0]}"
+                return f"{stage} failed (exit code {process.returncode})"
+            return None
                 
         except Exception as e:
-            task.status = DownloadStatus.FAILED
-            task.error_message = str(e)
+            return str(e)
     
     def _run_ffmpeg_with_progress(self, cmd: List[str], task: DownloadTask,
                                    stage: str, progress_start: float, progress_end: float,
@@ -4394,130 +5335,144 @@ class DownloadManager:
             # v17.7.5: Get the output file path from the command (last argument)
             output_file = cmd[-1] if cmd else None
             last_file_size = 0
-            last_progress_time = time.time()
+            last_progress_time = time.monotonic_ns()
             stall_logged = False
             
-            # Use encoding='utf-8' and errors='replace' to handle unicode in paths
+            # Progress comes from ffmpeg's key=value blocks on stdout (-progress
+            # pipe:1) instead of regex-scraping the stats line; -nostats keeps
+            # stderr down to real messages
+            cmd = [cmd[0], "-progress", "pipe:1", "-nostats"] + cmd[1:]
+            
+            # Binary pipes read with iter_pipe_lines(); the progress keys are
+            # ASCII and parsed as bytes, stderr is decoded for error reporting
             self.current_process = subprocess.Popen(
                 cmd, 
                 stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE, 
-                text=True,
-                encoding='utf-8',
-                errors='replace'
+                stderr=subprocess.PIPE,
+                bufsize=PIPE_BUFFER_SIZE,
+                start_new_session=True  # Own process group, see _stop_process()
             )
-            
-            time_re = re.compile(r'time=(\d+):(\d+):(\d+(?:\.\d+)?)')
-            fps_re = re.compile(r'fps=\s*([\d.]+)')
-            size_re = re.compile(r'size=\s*(\d+)(ki|Mi|Gi)?B')  # v17.7.5: Also parse size from ffmpeg output
-            total_duration = float(duration) if duration else 0
-            
-            stderr_lines = []  # Capture stderr for error reporting
-            
-            # v17.7.5: Start a background thread to monitor file growth during apparent stalls
-            file_monitor_active = True
-            conversion_start = time.time()
-            
-            def monitor_conversion_file():
-                """Background thread to show file growth during conversion."""
-                nonlocal last_file_size, stall_logged
-                check_interval = 2  # Check every 2 seconds
+            process = self.current_process
+            
+            total_duration_us = duration * 1_000_000 if duration else 0
+            # Microseconds of output -> share of this stage's progress range
+            us_scale = (progress_end - progress_start) / total_duration_us if total_duration_us else 0
+            
+            # Capture stderr for error reporting; only the tail is reported,
+            # so keep a ring of the last lines rather than the whole run
+            stderr_lines: Deque[str] = deque(maxlen=64)
+            
+            def drain_stderr():
+                # Read stderr concurrently so a chatty ffmpeg can't fill the pipe
+                for err_line in iter_pipe_lines(process.stderr):
+                    stderr_lines.append(err_line.decode('utf-8', 'replace'))
+            
+            stderr_thread = threading.Thread(target=drain_stderr, daemon=True)
+            stderr_thread.start()
+            
+            # v17.7.5: Monitor file growth during apparent stalls, on the
+            # shared poll thread (see ProgressPollService.watch)
+            # Poll ticks reuse the pass's monotonic clock read (now) for all
+            # timing instead of reading the wall clock again
+            conversion_start = last_size_check = time.monotonic_ns()
+            
+            def monitor_conversion_file(now: int) -> bool:
+                """Poll tick: show file growth during conversion."""
+                nonlocal last_file_size, stall_logged, last_size_check
+                if process.poll() is not None:
+                    return False
                 
-                while file_monitor_active and self.current_process and self.current_process.poll() is None:
-                    time.sleep(check_interval)
-                    
-                    # Check if progress appears stalled
-                    time_since_progress = time.time() - last_progress_time
+                # Check if progress appears stalled
+                time_since_progress = (now - last_progress_time) * 1e-9
+                
+                if time_since_progress > 5 and output_file:
+                    # One stat() per tick; a missing file just means ffmpeg
+                    # hasn't created it yet
+                    try:
+                        current_size = os.stat(output_file).st_size
+                    except OSError:
+                        return True
+                    if current_size > last_file_size:
+                        # File is growing - show activity
+                        size_delta = current_size - last_file_size
+                        interval = max((now - last_size_check) * 1e-9, 1e-3)
+                        write_rate = (size_delta * 8) / (interval * 1_000_000)  # Mbps
+                        
+                        size_str = self.progress_tracker.format_file_size(current_size)
+                        elapsed = (now - conversion_start) * 1e-9
+                        elapsed_str = f"{int(elapsed // 60)}m {int(elapsed % 60)}s" if elapsed >= 60 else f"{int(elapsed)}s"
+                        
+                        task.current_file_size = current_size
+                        task.status_detail = f"Converting... {size_str} written ({elapsed_str} elapsed, {write_rate:.1f} Mbps)"
+                        task.eta = "calculating..."  # Clear ETA since we don't have reliable progress
+                        self._notify("task_updated", task)
+                        
+                        if not stall_logged and time_since_progress > 10:
+                            self._notify("log", ("info", f"Conversion in progress - {size_str} written so far"))
+                            stall_logged = True
                     
-                    if time_since_progress > 5 and output_file and os.path.exists(output_file):
-                        try:
-                            current_size = os.path.getsize(output_file)
-                            
-                            if current_size > last_file_size:
-                                # File is growing - show activity
-                                size_delta = current_size - last_file_size
-                                write_rate = (size_delta * 8) / (check_interval * 1_000_000)  # Mbps
-                                
-                                size_str = self.progress_tracker.format_file_size(current_size)
-                                elapsed = time.time() - conversion_start
-                                elapsed_str = f"{int(elapsed // 60)}m {int(elapsed % 60)}s" if elapsed >= 60 else f"{int(elapsed)}s"
-                                
-                                task.current_file_size = current_size
-                                task.status_detail = f"Converting... {size_str} written ({elapsed_str} elapsed, {write_rate:.1f} Mbps)"
-                                task.eta = "calculating..."  # Clear ETA since we don't have reliable progress
-                                self._notify("task_updated", task)
-                                
-                                if not stall_logged and time_since_progress > 10:
-                                    self._notify("log", ("info", f"Conversion in progress - {size_str} written so far"))
-                                    stall_logged = True
-                            
-                            last_file_size = current_size
-                        except Exception:
-                            pass
+                    last_file_size = current_size
+                    last_size_check = now
+                return True
             
-            # Start monitor thread
-            monitor_thread = threading.Thread(target=monitor_conversion_file, daemon=True)
-            monitor_thread.start()
+            # Start file monitoring
+            poll_service = get_progress_poll_service()
+            poll_service.watch(monitor_conversion_file)
             
-            for line in self.current_process.stderr:
-                stderr_lines.append(line)  # Store for potential error reporting
+            out_time_us = None
+            fps = None
+            for line in iter_pipe_lines(process.stdout):
+                key, _, value = line.rstrip().partition(b'=')
                 
-                if self._paused:
-                    while self._paused and self._running:
-                        time.sleep(0.1)
+                if key == b"out_time_us" or key == b"out_time_ms":  # both are microseconds
+                    try:
+                        out_time_us = int(value)
+                    except ValueError:
+                        pass  # N/A before the first frame
+                    continue
+                if key == b"fps":
+                    try:
+                        fps = float(value)
+                    except ValueError:
+                        pass
+                    continue
+                if key == b"total_size":
+                    # v17.7.5: Track output size even if no time info
+                    if value.isdigit():
+                        task.current_file_size = int(value)
+                    continue
+                if key != b"progress":
+                    continue
                 
-                # v17.7.5: Parse size from ffmpeg output even if no time info
-                size_match = size_re.search(line)
-                if size_match:
-                    size_value = float(size_match.group(1))
-                    size_unit = size_match.group(2) or ""
-                    
-                    # Convert to bytes
-                    if size_unit == "ki":
-                        current_size = int(size_value * 1024)
-                    elif size_unit == "Mi":
-                        current_size = int(size_value * 1024 * 1024)
-                    elif size_unit == "Gi":
-                        current_size = int(size_value * 1024 * 1024 * 1024)
-                    else:
-                        current_size = int(size_value)
-                    
-                    task.current_file_size = current_size
+                # "progress=continue|end" closes a block: publish it once
+                self._pause_event.wait()
                 
-                if total_duration > 0:
-                    match = time_re.search(line)
-                    if match:
-                        h = float(match.group(1))
-                        m = float(match.group(2))
-                        s = float(match.group(3))
-                        current_time = h * 3600 + m * 60 + s
-                        pct = min(100, (current_time / total_duration) * 100)
-                        task.progress = progress_start + (pct / 100) * (progress_end - progress_start)
+                if total_duration_us > 0:
+                    if out_time_us is not None:
+                        task.progress = progress_start + min(out_time_us, total_duration_us) * us_scale
                         
                         # v17.7.5: Update last progress time
-                        last_progress_time = time.time()
+                        last_progress_time = time.monotonic_ns()
                         task.status_detail = None  # Clear status detail when we have real progress
                         stall_logged = False
                         
-                        # Update progress tracker
-                        self.progress_tracker.update(task.progress)
+                        # Update progress tracker (reuse the timestamp read above)
+                        snapshot = self.progress_tracker.tick(task.progress, now=last_progress_time)
                         
                         # Parse FPS
-                        fps_match = fps_re.search(line)
-                        if fps_match:
-                            fps = float(fps_match.group(1))
-                            self.progress_tracker.set_conversion_fps(fps)
-                            task.conversion_fps = self.progress_tracker.format_fps()
+                        if fps is not None:
+                            task.conversion_fps_value = fps
                         
                         # Get ETA
-                        task.eta = self.progress_tracker.format_eta()
+                        task.eta = snapshot.eta_text
                         
                         self._notify("task_updated", task)
             
             # v17.7.5: Stop file monitor
-            file_monitor_active = False
+            poll_service.unwatch(monitor_conversion_file)
             
             self.current_process.wait()
+            stderr_thread.join(timeout=1)
             
             # Clear status detail after completion
             task.status_detail = None
@@ -4574,6 +5529,9 @@ class EnhancedProgressBar(ctk.CTkFrame):
             "error": COLORS["accent_red"],
             "idle": COLORS["border_light"]
         }
+        # Fill color for the current stage, resolved when the stage is set
+        # rather than on every animation frame
+        self._fill_color = self.stage_colors["idle"]
 
         # Canvas for custom drawing
         self.canvas = ctk.CTkCanvas(
@@ -4584,13 +5542,27 @@ class EnhancedProgressBar(ctk.CTkFrame):
         )
         self.canvas.pack(fill="x")
 
+        # Track and fill are created once; redraws just move them with
+        # coords() instead of deleting and recreating items every frame
+        self._width = 0  # Canvas width from the last <Configure>
+        self._track_item = self.canvas.create_rectangle(
+            0, 0, 0, 0, fill=COLORS["border"], outline=""
+        )
+        self._fill_item = self.canvas.create_rectangle(
+            0, 0, 0, 0, fill=self._fill_color, outline=""
+        )
+        self._drawn_color = self._fill_color
+        self._drawn_fill_px = -1  # Fill width last drawn, in whole pixels
+
         # Bind resize
         self.canvas.bind("<Configure>", self._redraw)
 
     def set_progress(self, percentage, stage="idle"):
         """Update progress with smooth animation."""
         self._animation_target = max(0, min(100, percentage))
-        self.stage = stage
+        if stage != self.stage:
+            self.stage = stage
+            self._fill_color = self.stage_colors.get(stage, self.stage_colors["idle"])
 
         # Animate toward target
         if not self.animating:
@@ -4624,31 +5596,26 @@ class EnhancedProgressBar(ctk.CTkFrame):
 
     def _redraw(self, event=None):
         """Redraw the progress bar."""
-        self.canvas.delete("all")
-
-        width = self.canvas.winfo_width()
         height = 6
 
+        if event is not None:
+            # Resized: the background track spans the full width
+            self._width = event.width
+            self.canvas.coords(self._track_item, 0, 0, self._width, height)
+
+        width = self._width
         if width <= 1:
             return
 
-        # Background track (full width, rounded)
-        self.canvas.create_rectangle(
-            0, 0, width, height,
-            fill=COLORS["border"],
-            outline=""
-        )
-
-        # Progress fill
-        if self.progress > 0:
-            fill_width = (self.progress / 100) * width
-            color = self.stage_colors.get(self.stage, self.stage_colors["idle"])
-
-            self.canvas.create_rectangle(
-                0, 0, fill_width, height,
-                fill=color,
-                outline=""
-            )
+        # Progress fill (zero width draws nothing). Easing frames that don't
+        # move the edge by a whole pixel leave the canvas alone.
+        fill_px = int(self.progress * width / 100 + 0.5) if self.progress > 0 else 0
+        if fill_px != self._drawn_fill_px:
+            self._drawn_fill_px = fill_px
+            self.canvas.coords(self._fill_item, 0, 0, fill_px, height)
+        if self._fill_color != self._drawn_color:
+            self._drawn_color = self._fill_color
+            self.canvas.itemconfigure(self._fill_item, fill=self._fill_color)
 
 
 class ToolTip:
@@ -5640,10 +6607,17 @@ class SettingsManager:
         self.config_path = config_path or SETTINGS_PATH
         # Ensure directory exists
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
+        self._mtime_ns = 0
         self.settings = self._load_settings()
         # Save immediately to ensure file exists with defaults
         self.save()
     
+    def _file_mtime_ns(self) -> int:
+        try:
+            return os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            return 0
+    
     def _load_settings(self) -> Dict[str, Any]:
         """Load settings from file, merging with defaults."""
         defaults = {
@@ -5703,9 +6677,28 @@ class SettingsManager:
         try:
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
             save_json_file(self.config_path, self.settings)
+            self._mtime_ns = self._file_mtime_ns()
         except Exception as e:
             print(f"Error saving settings: {e}")
     
+    def reload_if_changed(self) -> bool:
+        """Re-read settings only if the file changed on disk since the last load/save.
+        
+        Another SettingsManager (e.g. the settings window) may have written the
+        file; an unchanged mtime makes this a single stat() call.
+        """
+        mtime_ns = self._file_mtime_ns()
+        if mtime_ns == self._mtime_ns:
+            return False
+        self.settings = self._load_settings()
+        self._mtime_ns = mtime_ns
+        return True
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a shallow copy of the current settings, reloading first if stale."""
+        self.reload_if_changed()
+        return dict(self.settings)
+    
     def get(self, key: str, default=None):
         """Get setting value."""
         return self.settings.get(key, default)
@@ -5722,36 +6715,111 @@ class SettingsManager:
 
 
 class HistoryManager:
-    """Manages download history."""
+    """Manages download history.
     
-    def __init__(self, history_path: Path):
-        self.history_path = history_path
-        self.entries = self._load()
+    Entries live in a SQLite database (WAL mode) so adding a download is a
+    single-row write instead of re-serializing the whole list. A legacy
+    history.json is imported once and then renamed to history.json.bak.
+    If the database can't be opened, history is kept in memory for the
+    session only.
+    """
     
-    def _load(self) -> List[Dict]:
-        """Load history."""
-        return load_json_file(self.history_path, [])
+    MAX_ENTRIES = 1000
     
-    def save(self):
-        """Save history."""
-        save_json_file(self.history_path, self.entries)
+    def __init__(self, db_path: Path, legacy_path: Optional[Path] = HISTORY_PATH):
+        self.db_path = db_path
+        # One connection is shared by the UI and the download worker
+        self._lock = threading.Lock()
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = self._connect(str(db_path))
+        except (sqlite3.Error, OSError) as e:
+            print(f"Warning: History database unavailable, history will not be saved: {e}")
+            self._conn = self._connect(":memory:")
+            # Importing into memory would still rename the file; keep it for next time
+            legacy_path = None
+        if legacy_path is not None and legacy_path.exists():
+            self._migrate_json(legacy_path)
+    
+    @staticmethod
+    def _connect(database: str) -> sqlite3.Connection:
+        """Open database and create the history table if needed."""
+        conn = sqlite3.connect(database, isolation_level=None, check_same_thread=False)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS history ("
+                "id TEXT PRIMARY KEY, json TEXT NOT NULL, completed_at INTEGER)"
+            )
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+    
+    @staticmethod
+    def _entry_key(entry: Dict) -> str:
+        """Primary key for an entry - re-downloading a video replaces its row."""
+        return str(entry.get("id") or entry.get("output_path") or entry.get("url")
+                   or entry.get("downloaded_at") or time.time())
+    
+    def _migrate_json(self, legacy_path: Path):
+        """One-time import of history.json (newest-first list) into the database."""
+        entries = load_json_file(legacy_path, [])
+        if not isinstance(entries, list):
+            entries = []
+        now = int(time.time())
+        rows = [
+            (self._entry_key(e), json.dumps(e, default=str), now)
+            for e in reversed(entries) if isinstance(e, dict)
+        ]
+        try:
+            with self._conn:
+                self._conn.execute("BEGIN")
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO history (id, json, completed_at) VALUES (?, ?, ?)", rows
+                )
+            os.replace(legacy_path, legacy_path.with_name(legacy_path.name + ".bak"))
+        except (sqlite3.Error, OSError) as e:
+            print(f"Warning: Could not migrate {legacy_path}: {e}")
+    
+    @property
+    def entries(self) -> List[Dict]:
+        """All entries, newest first."""
+        with self._lock:
+            rows = self._conn.execute("SELECT json FROM history ORDER BY rowid DESC").fetchall()
+        return [json.loads(row[0]) for row in rows]
     
     def add(self, entry: Dict):
         """Add entry."""
-        self.entries.insert(0, entry)
-        if len(self.entries) > 1000:
-            self.entries = self.entries[:1000]
-        self.save()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO history (id, json, completed_at) VALUES (?, ?, ?)",
+                (self._entry_key(entry), json.dumps(entry, default=str), int(time.time()))
+            )
+            # Trim anything older than the newest MAX_ENTRIES rows
+            self._conn.execute(
+                "DELETE FROM history WHERE rowid <= "
+                "(SELECT rowid FROM history ORDER BY rowid DESC LIMIT 1 OFFSET ?)",
+                (self.MAX_ENTRIES,)
+            )
     
     def search(self, query: str) -> List[Dict]:
-        """Search history."""
-        query = query.lower()
-        return [e for e in self.entries if query in e.get("title", "").lower()]
+        """Search history by title (case-insensitive), newest first."""
+        # The title is matched in SQL, so only the hits are decoded
+        pattern = "%" + query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT json FROM history WHERE json_extract(json, '$.title') LIKE ? ESCAPE '\\' "
+                "ORDER BY rowid DESC",
+                (pattern,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
     
     def clear(self):
         """Clear history."""
-        self.entries.clear()
-        self.save()
+        with self._lock:
+            self._conn.execute("DELETE FROM history")
 
 
 # ============================================================================
@@ -7717,12 +8785,15 @@ class ResourceGauge(ctk.CTkCanvas):
 class YtDlpGUI(ctk.CTk):
     """Main application window."""
     
+    # Milliseconds between applications of coalesced task_updated events
+    TASK_UI_REFRESH_MS = 50
+    
     def __init__(self):
         super().__init__()
         
         # Initialize managers
         self.settings_mgr = SettingsManager(SETTINGS_PATH)
-        self.history_mgr = HistoryManager(HISTORY_PATH)
+        self.history_mgr = HistoryManager(HISTORY_DB_PATH)
         
         # Configure CustomTkinter
         ctk.set_appearance_mode("dark")
@@ -7763,7 +8834,7 @@ class YtDlpGUI(ctk.CTk):
         self.system_monitor.start_monitoring()
         
         # Initialize components
-        self.ytdlp = YtDlpInterface()
+        self.ytdlp = get_ytdlp()
         self.thumbnail_manager = ThumbnailManager()
         self.config = load_json_file(CONFIG_PATH, {
             "output_dir": str(Path.home() / "Desktop"),
@@ -7775,8 +8846,13 @@ class YtDlpGUI(ctk.CTk):
         
         self.download_manager = DownloadManager(
             self.ytdlp, 
-            self.config.get("output_dir", str(Path.home() / "Desktop"))
+            self.config.get("output_dir", str(Path.home() / "Desktop")),
+            self.history_mgr
         )
+        # Latest task_updated per task id, drained by _drain_task_updates
+        self._pending_task_updates: Dict[str, DownloadTask] = {}
+        self._pending_task_lock = threading.Lock()
+        self._task_drain_scheduled = False
         self.download_manager.add_callback(self._on_download_event)
         
         # Track which tasks we've already logged as completed (to avoid duplicate messages)
@@ -7803,8 +8879,8 @@ class YtDlpGUI(ctk.CTk):
         # Setup drag & drop (if available)
         self._setup_drag_drop()
         
-        # Check clipboard after a short delay
-        self.after(500, self._check_clipboard_on_start)
+        # Check clipboard once the window has painted
+        self.after_idle(self._check_clipboard_on_start)
         
         # Check for yt-dlp updates on startup (v17.10.0)
         self.after(3000, self._check_ytdlp_update_on_startup)
@@ -8383,16 +9459,16 @@ class YtDlpGUI(ctk.CTk):
 
         # Reload thumbnail at new size
         if self.current_video and self.current_video.thumbnail:
-            def reload_thumb():
-                thumb = self.thumbnail_manager.get_thumbnail(
-                    self.current_video.thumbnail,
-                    self.current_video.id,
-                    new_size
-                )
-                if thumb:
-                    self.after(0, lambda: self.thumb_label.configure(image=thumb, text=""))
+            self._load_thumbnail(self.current_video.thumbnail, self.current_video.id, new_size)
 
-            threading.Thread(target=reload_thumb, daemon=True).start()
+    def _load_thumbnail(self, url: str, video_id: str, size: tuple):
+        """Fetch a thumbnail on the thumbnail pool and show it when ready."""
+        def on_done(future):
+            thumb = future.result()
+            if thumb:
+                self.after(0, lambda: self.thumb_label.configure(image=thumb, text=""))
+        
+        self.thumbnail_manager.get_thumbnail_async(url, video_id, size).add_done_callback(on_done)
 
     def _get_responsive_thumb_size(self):
         """Calculate responsive thumbnail size based on current video frame width."""
@@ -8430,16 +9506,7 @@ class YtDlpGUI(ctk.CTk):
 
         # Reload thumbnail at correct size
         if self.current_video.thumbnail:
-            def reload_thumb():
-                thumb = self.thumbnail_manager.get_thumbnail(
-                    self.current_video.thumbnail,
-                    self.current_video.id,
-                    thumb_size
-                )
-                if thumb:
-                    self.after(0, lambda: self.thumb_label.configure(image=thumb, text=""))
-
-            threading.Thread(target=reload_thumb, daemon=True).start()
+            self._load_thumbnail(self.current_video.thumbnail, self.current_video.id, thumb_size)
 
     def _create_progress_section(self):
         """
@@ -8742,16 +9809,14 @@ class YtDlpGUI(ctk.CTk):
                 "https://youtube.com/watch",
                 "https://www.youtube.com/playlist"
             ]):
-                current = self.url_entry.get()
-                if clip != current:
-                    self.url_entry.delete(0, "end")
-                    self.url_entry.insert(0, clip)
+                self._set_url(clip)
         except Exception:
             pass
     
     def _on_close(self):
         """Handle window close."""
         self._save_config()
+        self.download_manager.shutdown()
         self.destroy()
     
     def _save_config(self):
@@ -9353,8 +10418,7 @@ class YtDlpGUI(ctk.CTk):
             
             # Automatically analyze the single video
             single_url = f"https://www.youtube.com/watch?v={video_id}"
-            self.url_entry.delete(0, "end")
-            self.url_entry.insert(0, single_url)
+            self._set_url(single_url)
             
             # Re-analyze as single video
             self.after(100, self._analyze)
@@ -9402,17 +10466,10 @@ class YtDlpGUI(ctk.CTk):
 
         # Load thumbnail with responsive size
         if info.thumbnail:
-            def load_thumb():
-                # Get responsive size (will use default if frame not rendered yet)
-                thumb_size = self._get_responsive_thumb_size()
-                self._current_thumb_size = thumb_size
-                thumb = self.thumbnail_manager.get_thumbnail(
-                    info.thumbnail, info.id, thumb_size
-                )
-                if thumb:
-                    self.after(0, lambda: self.thumb_label.configure(image=thumb, text=""))
-
-            threading.Thread(target=load_thumb, daemon=True).start()
+            # Get responsive size (will use default if frame not rendered yet)
+            thumb_size = self._get_responsive_thumb_size()
+            self._current_thumb_size = thumb_size
+            self._load_thumbnail(info.thumbnail, info.id, thumb_size)
         
         # Clear old format cards
         for card in self.format_cards:
@@ -9772,8 +10829,7 @@ class YtDlpGUI(ctk.CTk):
                     self.after(0, lambda: self.log_panel.log("Merging video + audio with QuickTime-compatible encoding", "info"))
                     
                     # Get encoding settings
-                    settings_mgr = SettingsManager(SETTINGS_PATH)
-                    encoder_type = settings_mgr.get("encoder_type", "auto")
+                    encoder_type = self.settings_mgr.get("encoder_type", "auto")
                     
                     if encoder_type == "cpu":
                         video_codec = "libx264"
@@ -9812,38 +10868,38 @@ class YtDlpGUI(ctk.CTk):
                 
                 self.after(0, lambda: self.log_panel.log(f"Encoding with ffmpeg (this may take a while)...", "info"))
                 
-                # Run ffmpeg merge/encode
+                # Run ffmpeg merge/encode (binary stderr; only the stats
+                # fields below are ever looked at)
                 process = subprocess.Popen(
                     ffmpeg_cmd,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
-                    text=True,
-                    encoding='utf-8',
-                    errors='replace'
+                    bufsize=PIPE_BUFFER_SIZE
                 )
                 
                 # Monitor encoding progress with stats
                 duration = video_info.duration or 0
-                time_re = re.compile(r'time=(\d+):(\d+):(\d+(?:\.\d+)?)')
-                fps_re = re.compile(r'fps=\s*(\d+(?:\.\d+)?)')
-                speed_re = re.compile(r'speed=\s*(\d+(?:\.\d+)?)x')
                 encode_start_time = time.time()
                 
-                for line in process.stderr:
+                for line in iter_pipe_lines(process.stderr):
                     if duration > 0:
-                        match = time_re.search(line)
+                        match = _FFMPEG_TIME_RE.search(line)
                         if match:
-                            h = float(match.group(1))
-                            m = float(match.group(2))
-                            s = float(match.group(3))
-                            current_time = h * 3600 + m * 60 + s
+                            # b"time=HH:MM:SS.cc" - digits at fixed offsets
+                            b = match.group()
+                            current_time = (
+                                ((b[5] - 48) * 10 + b[6] - 48) * 3600
+                                + ((b[8] - 48) * 10 + b[9] - 48) * 60
+                                + (b[11] - 48) * 10 + b[12] - 48
+                                + ((b[14] - 48) * 10 + b[15] - 48) * 0.01
+                            )
                             encode_pct = min(100, (current_time / duration) * 100)
                             # Map encoding progress to 50-80% range
                             overall_pct = 50 + (encode_pct * 0.3)
                             
                             # Extract FPS and speed
-                            fps_match = fps_re.search(line)
-                            speed_match = speed_re.search(line)
+                            fps_match = _FFMPEG_FPS_RE.search(line)
+                            speed_match = _FFMPEG_SPEED_RE.search(line)
                             
                             fps_str = f"{float(fps_match.group(1)):.0f}" if fps_match else "--"
                             speed_str = f"{float(speed_match.group(1)):.1f}x" if speed_match else "--"
@@ -10086,123 +11142,143 @@ class YtDlpGUI(ctk.CTk):
         self.download_manager.start()
     
     def _on_download_event(self, event: str, data: Any):
+        """Handle download manager events (called from worker threads)."""
+        if event == "task_updated":
+            # v19.1: progress updates are coalesced - only the latest state
+            # of each task is kept, and one Tk callback applies them all
+            # every TASK_UI_REFRESH_MS instead of one callback per event
+            with self._pending_task_lock:
+                self._pending_task_updates[data.id] = data
+                if self._task_drain_scheduled:
+                    return
+                self._task_drain_scheduled = True
+            self.after(self.TASK_UI_REFRESH_MS, self._drain_task_updates)
+            return
+        self.after(0, lambda: self._render_download_event(event, data))
+    
+    def _drain_task_updates(self):
+        """Apply the coalesced task updates (runs on the Tk thread)."""
+        with self._pending_task_lock:
+            pending = self._pending_task_updates
+            self._pending_task_updates = {}
+            self._task_drain_scheduled = False
+        for task in pending.values():
+            self._render_download_event("task_updated", task)
+    
+    def _render_download_event(self, event: str, data: Any):
         """Handle download manager events with modern UI updates."""
-        def update():
-            if event == "task_progress" or event == "task_updated":
-                task = data
-                
-                # Determine stage for color coding
-                stage_name = "idle"
-                stage_text = "⏳ Ready to download"
-                
-                if task.status == DownloadStatus.DOWNLOADING:
-                    if task.progress < 40:
-                        stage_name = "downloading_video"
-                        stage_text = "Stage 1/3: Downloading video"
-                    elif task.progress < 60:
-                        stage_name = "downloading_audio"
-                        stage_text = "Stage 2/3: Downloading audio"
-                    else:
-                        stage_name = "downloading_audio"
-                        stage_text = "Stage 2/3: Downloading audio"
-                    
-                    if task.status_detail:
-                        stage_text = task.status_detail
-                        
-                elif task.status == DownloadStatus.CONVERTING:
-                    stage_name = "converting"
-                    fmt = task.selected_format
-                    
-                    if task.status_detail:
-                        stage_text = task.status_detail
-                    elif fmt and fmt.height:
-                        stage_text = f"Stage 3/3: Converting ({fmt.height}p)"
-                    else:
-                        stage_text = "Stage 3/3: Converting"
-                        
-                elif task.status == DownloadStatus.COMPLETED:
-                    stage_name = "idle"
-                    stage_text = f"✅ Completed: {task.video_info.title[:50]}"
-                
-                # Update enhanced progress bar
-                self.main_progress.set_progress(task.progress, stage=stage_name)
-                
-                # Update status indicator with animation
-                if task.status in [DownloadStatus.DOWNLOADING, DownloadStatus.CONVERTING]:
-                    self.main_progress.start_animation()
-                    self.queue_status.configure(text="Active")
-                    self.status_dot.configure(text_color=COLORS["accent_green"])
-                elif task.status == DownloadStatus.COMPLETED:
-                    self.main_progress.stop_animation()
-                    self.queue_status.configure(text="Complete")
-                    self.status_dot.configure(text_color=COLORS["accent_green"])
+        if event == "task_progress" or event == "task_updated":
+            task = data
+            
+            # Determine stage for color coding
+            stage_name = "idle"
+            stage_text = "⏳ Ready to download"
+            
+            if task.status == DownloadStatus.DOWNLOADING:
+                # Video and audio download side by side, so task.progress (the
+                # sum of both shares) can't tell the stage; the task says
+                # whether the audio is still running
+                stage_name = "downloading_video"
+                if task.audio_downloading:
+                    stage_text = "Stage 1/2: Downloading video + audio"
                 else:
-                    self.main_progress.stop_animation()
-                    self.queue_status.configure(text="Idle")
-                    self.status_dot.configure(text_color=COLORS["text_tertiary"])
-                
-                # Update metrics
-                self.progress_label.configure(text=stage_text)
-                self.percentage_label.configure(text=f"{task.progress:.0f}%")
+                    stage_text = "Stage 1/2: Downloading video"
                 
-                # Speed metric
-                speed_text = "--"
-                if task.download_speed:
-                    speed_text = task.download_speed
-                elif task.current_file_size and task.current_file_size > 0:
-                    if task.current_file_size >= 1024 ** 3:
-                        speed_text = f"{task.current_file_size / (1024 ** 3):.2f} GB"
-                    elif task.current_file_size >= 1024 ** 2:
-                        speed_text = f"{task.current_file_size / (1024 ** 2):.1f} MB"
-                    else:
-                        speed_text = f"{task.current_file_size / 1024:.1f} KB"
-                
-                self.speed_label.configure(text=speed_text)
+                if task.status_detail:
+                    stage_text = task.status_detail
+                    
+            elif task.status == DownloadStatus.CONVERTING:
+                stage_name = "converting"
+                fmt = task.selected_format
                 
-                # FPS metric
-                if task.conversion_fps:
-                    self.fps_label.configure(text=task.conversion_fps)
+                if task.status_detail:
+                    stage_text = task.status_detail
+                elif fmt and fmt.height:
+                    stage_text = f"Stage 2/2: Converting ({fmt.height}p)"
                 else:
-                    self.fps_label.configure(text="--")
-                
-                # ETA metric
-                if task.eta:
-                    self.eta_label.configure(text=task.eta)
+                    stage_text = "Stage 2/2: Converting"
+                    
+            elif task.status == DownloadStatus.COMPLETED:
+                stage_name = "idle"
+                stage_text = f"✅ Completed: {task.video_info.title[:50]}"
+            
+            # Update enhanced progress bar
+            self.main_progress.set_progress(task.progress, stage=stage_name)
+            
+            # Update status indicator with animation
+            if task.status in [DownloadStatus.DOWNLOADING, DownloadStatus.CONVERTING]:
+                self.main_progress.start_animation()
+                self.queue_status.configure(text="Active")
+                self.status_dot.configure(text_color=COLORS["accent_green"])
+            elif task.status == DownloadStatus.COMPLETED:
+                self.main_progress.stop_animation()
+                self.queue_status.configure(text="Complete")
+                self.status_dot.configure(text_color=COLORS["accent_green"])
+            else:
+                self.main_progress.stop_animation()
+                self.queue_status.configure(text="Idle")
+                self.status_dot.configure(text_color=COLORS["text_tertiary"])
+            
+            # Update metrics
+            self.progress_label.configure(text=stage_text)
+            self.percentage_label.configure(text=f"{task.progress:.0f}%")
+            
+            # Speed metric
+            speed_text = "--"
+            if task.download_speed:
+                speed_text = task.download_speed
+            elif task.current_file_size and task.current_file_size > 0:
+                if task.current_file_size >= 1024 ** 3:
+                    speed_text = f"{task.current_file_size / (1024 ** 3):.2f} GB"
+                elif task.current_file_size >= 1024 ** 2:
+                    speed_text = f"{task.current_file_size / (1024 ** 2):.1f} MB"
                 else:
-                    self.eta_label.configure(text="--")
-                
-                # Size metric (new for v18)
-                if task.file_size:
-                    if task.file_size >= 1024 ** 3:
-                        size_str = f"{task.file_size / (1024 ** 3):.2f} GB"
-                    elif task.file_size >= 1024 ** 2:
-                        size_str = f"{task.file_size / (1024 ** 2):.0f} MB"
-                    else:
-                        size_str = f"{task.file_size / 1024:.0f} KB"
-                    self.size_label.configure(text=size_str)
+                    speed_text = f"{task.current_file_size / 1024:.1f} KB"
+            
+            self.speed_label.configure(text=speed_text)
+            
+            # FPS metric
+            if task.conversion_fps:
+                self.fps_label.configure(text=task.conversion_fps)
+            else:
+                self.fps_label.configure(text="--")
+            
+            # ETA metric
+            if task.eta:
+                self.eta_label.configure(text=task.eta)
+            else:
+                self.eta_label.configure(text="--")
+            
+            # Size metric (new for v18)
+            if task.file_size:
+                if task.file_size >= 1024 ** 3:
+                    size_str = f"{task.file_size / (1024 ** 3):.2f} GB"
+                elif task.file_size >= 1024 ** 2:
+                    size_str = f"{task.file_size / (1024 ** 2):.0f} MB"
                 else:
-                    self.size_label.configure(text="--")
-                
-                # Log stage changes
-                if task.status == DownloadStatus.CONVERTING and event == "task_updated":
-                    self.log_panel.log("Converting to QuickTime-compatible format...", "info")
-                elif task.status == DownloadStatus.COMPLETED:
-                    # Only log completion once per task (avoid duplicate messages)
-                    if task.id not in self._logged_completed_tasks:
-                        self._logged_completed_tasks.add(task.id)
-                        self.log_panel.log(f"✅ Completed: {task.video_info.title}", "success")
-                    self.main_progress.set_progress(100, stage="idle")
-                elif task.status == DownloadStatus.FAILED:
-                    self.log_panel.log(f"[X] Failed: {task.error_message}", "error")
-                    self.progress_label.configure(text="Download failed")
-                    self.queue_status.configure(text="Failed")
-            
-            elif event == "log":
-                # Handle log messages from download manager
-                level, message = data
-                self.log_panel.log(message, level)
-        
-        self.after(0, update)
+                    size_str = f"{task.file_size / 1024:.0f} KB"
+                self.size_label.configure(text=size_str)
+            else:
+                self.size_label.configure(text="--")
+            
+            # Log stage changes
+            if task.status == DownloadStatus.CONVERTING and event == "task_updated":
+                self.log_panel.log("Converting to QuickTime-compatible format...", "info")
+            elif task.status == DownloadStatus.COMPLETED:
+                # Only log completion once per task (avoid duplicate messages)
+                if task.id not in self._logged_completed_tasks:
+                    self._logged_completed_tasks.add(task.id)
+                    self.log_panel.log(f"✅ Completed: {task.video_info.title}", "success")
+                self.main_progress.set_progress(100, stage="idle")
+            elif task.status == DownloadStatus.FAILED:
+                self.log_panel.log(f"[X] Failed: {task.error_message}", "error")
+                self.progress_label.configure(text="Download failed")
+                self.queue_status.configure(text="Failed")
+        
+        elif event == "log":
+            # Handle log messages from download manager
+            level, message = data
+            self.log_panel.log(message, level)
     
     def _handle_error(self, message: str):
         """Handle and display errors."""
@@ -10389,13 +11465,20 @@ https://github.com/bytePatrol/YT-DLP-GUI-for-MacOS
         # Enter in URL entry to analyze
         self.url_entry.bind("<Return>", lambda e: self._analyze())
     
+    def _set_url(self, text: str) -> bool:
+        """Replace the URL field contents; no Tk work if it already holds text."""
+        if self.url_entry.get() == text:
+            return False
+        self.url_entry.delete(0, "end")
+        self.url_entry.insert(0, text)
+        return True
+    
     def _handle_paste_shortcut(self, event=None):
         """Handle Cmd+V paste shortcut."""
         try:
             clipboard = self.clipboard_get()
-            if "youtube.com" in clipboard or "youtu.be" in clipboard:
-                self.url_entry.delete(0, "end")
-                self.url_entry.insert(0, clipboard)
+            if _is_yt_url(clipboard):
+                self._set_url(clipboard)
                 self.log_panel.log("URL pasted from clipboard", "info")
                 self.url_entry.focus()
         except Exception:
@@ -10417,10 +11500,14 @@ https://github.com/bytePatrol/YT-DLP-GUI-for-MacOS
     def _handle_drop(self, event):
         """Handle drag & drop of URL."""
         try:
-            data = str(event.data).strip('{}')
-            if "youtube.com" in data or "youtu.be" in data:
-                self.url_entry.delete(0, "end")
-                self.url_entry.insert(0, data)
+            # Let Tcl parse the drop list ({...} quoting, spaces) natively
+            try:
+                parts = self.tk.splitlist(event.data)
+                data = parts[0] if parts else ""
+            except tk.TclError:
+                data = str(event.data).strip('{}')
+            if _is_yt_url(data):
+                self._set_url(data)
                 self.log_panel.log("URL dropped", "info")
         except Exception:
             pass
@@ -10514,10 +11601,28 @@ https://github.com/bytePatrol/YT-DLP-GUI-for-MacOS
         self.after(1000, self._update_resource_gauges)
     
     def _check_clipboard_on_start(self):
-        """Check clipboard for YouTube URL on startup."""
+        """Check clipboard for YouTube URL on startup.
+        
+        The pasteboard is read with pbpaste on a worker thread so a slow
+        pasteboard server never stalls the first paint; Tk's own clipboard
+        is only used (on the main thread) if pbpaste is unavailable.
+        """
+        def read_thread():
+            try:
+                result = subprocess.run(["pbpaste"], capture_output=True, text=True, timeout=2)
+                clipboard = result.stdout if result.returncode == 0 else None
+            except (OSError, subprocess.SubprocessError):
+                clipboard = None
+            self.after(0, lambda: self._apply_startup_clipboard(clipboard))
+        
+        threading.Thread(target=read_thread, daemon=True).start()
+    
+    def _apply_startup_clipboard(self, clipboard: Optional[str]):
+        """Fill the URL field from clipboard text read at startup (main thread)."""
         try:
-            clipboard = self.clipboard_get()
-            if ("youtube.com" in clipboard or "youtu.be" in clipboard) and not self.url_entry.get():
+            if clipboard is None:
+                clipboard = self.clipboard_get()
+            if _is_yt_url(clipboard) and not self.url_entry.get():
                 self.url_entry.insert(0, clipboard)
                 self.log_panel.log("YouTube URL detected in clipboard", "info")
         except Exception:
@@ -10528,7 +11633,9 @@ https://github.com/bytePatrol/YT-DLP-GUI-for-MacOS
         """Open output folder in Finder."""
         output_dir = self.config.get("output_dir", str(Path.home() / "Desktop"))
         if os.path.isdir(output_dir):
-            subprocess.run(["open", output_dir], check=False)
+            # Fire-and-forget: don't hold the UI thread while Finder comes up
+            subprocess.Popen(["open", output_dir],
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     
     # =========================================================================
     # YT-DLP UPDATE METHODS (v17.10.0)
@@ -10811,10 +11918,15 @@ https://github.com/bytePatrol/YT-DLP-GUI-for-MacOS
 # ENTRY POINT
 # ============================================================================
 
+def _ensure_dirs():
+    """Create config, cache and Application Support directories (kept out of import)."""
+    for d in (CONFIG_DIR, CACHE_DIR, APP_SUPPORT_DIR):
+        d.mkdir(parents=True, exist_ok=True)
+
+
 def main():
     """Application entry point."""
-    # Ensure cache directory exists
-    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_dirs()
     
     # Create and run app
     app = YtDlpGUI()